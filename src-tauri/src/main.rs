@@ -84,21 +84,51 @@ fn init_logging() -> Result<PathBuf, Box<dyn std::error::Error>> {
     fs::create_dir_all(&log_dir)?;
     let log_file = log_dir.join("starandom_debug.log");
     
-    // 写入启动日志
-    let mut file = fs::OpenOptions::new()
+    // 写入启动日志（先写入缓冲区，最后一次性落盘）
+    let file = fs::OpenOptions::new()
         .create(true)
         .append(true)
         .open(&log_file)?;
+    let mut writer = std::io::BufWriter::new(file);
     
     let timestamp = chrono::Utc::now().format("%Y-%m-%d %H:%M:%S");
-    writeln!(file, "\n[{}] ==> StarRandom 星抽奖系统 v1.0.7 启动", timestamp)?;
-    writeln!(file, "[{}] © 2025 河南星熠寻光科技有限公司 & vistamin. All rights reserved.", timestamp)?;
-    writeln!(file, "[{}] 当前工作目录: {:?}", timestamp, std::env::current_dir()?)?;
-    writeln!(file, "[{}] 日志文件位置: {:?}", timestamp, log_file)?;
+    writeln!(writer, "\n[{}] ==> StarRandom 星抽奖系统 v1.0.7 启动", timestamp)?;
+    writeln!(writer, "[{}] © 2025 河南星熠寻光科技有限公司 & vistamin. All rights reserved.", timestamp)?;
+    writeln!(writer, "[{}] 当前工作目录: {:?}", timestamp, std::env::current_dir()?)?;
+    writeln!(writer, "[{}] 日志文件位置: {:?}", timestamp, log_file)?;
+    writer.flush()?;
     
     Ok(log_file)
 }
 
+// 原子写入的临时文件序号，同一进程内并发写同一路径时各自使用不同的临时文件
+static ATOMIC_WRITE_COUNTER: std::sync::atomic::AtomicU64 = std::sync::atomic::AtomicU64::new(0);
+
+// 原子写入文件：先写入同目录下的临时文件，再重命名覆盖目标文件；
+// sync为true时重命名前先把临时文件刷到磁盘，只用于历史索引和任务文件，设置等小文件不承担每次落盘的延迟
+fn write_file_atomic(path: &std::path::Path, data: &[u8], sync: bool) -> std::io::Result<()> {
+    let mut tmp_name = path.file_name().unwrap_or_default().to_os_string();
+    let seq = ATOMIC_WRITE_COUNTER.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+    tmp_name.push(format!(".{}.{}.tmp", std::process::id(), seq));
+    let tmp_path = path.with_file_name(tmp_name);
+
+    let write_result = std::fs::File::create(&tmp_path).and_then(|mut file| {
+        file.write_all(data)?;
+        if sync {
+            file.sync_all()?;
+        }
+        Ok(())
+    });
+    if let Err(e) = write_result {
+        let _ = std::fs::remove_file(&tmp_path);
+        return Err(e);
+    }
+    std::fs::rename(&tmp_path, path).map_err(|e| {
+        let _ = std::fs::remove_file(&tmp_path);
+        e
+    })
+}
+
 // 抽奖命令
 #[tauri::command]
 fn greet(name: &str) -> String {
@@ -206,7 +236,7 @@ async fn get_app_paths(app_handle: tauri::AppHandle) -> Result<serde_json::Value
 // 保存应用设置
 #[tauri::command]
 async fn save_settings(app_handle: tauri::AppHandle, settings: serde_json::Value) -> Result<(), String> {
-    log::info!("保存设置: {}", settings);
+    log::debug!("保存设置: {}", settings);
     
     let config_dir = app_handle.path().app_config_dir().map_err(|e| e.to_string())?;
     let settings_path = config_dir.join("settings.json");
@@ -216,8 +246,9 @@ async fn save_settings(app_handle: tauri::AppHandle, settings: serde_json::Value
         std::fs::create_dir_all(parent).map_err(|e| e.to_string())?;
     }
     
-    let settings_str = serde_json::to_string_pretty(&settings).map_err(|e| e.to_string())?;
-    std::fs::write(&settings_path, settings_str).map_err(|e| e.to_string())?;
+    // 序列化为字节缓冲后一次性原子写入
+    let settings_bytes = serde_json::to_vec_pretty(&settings).map_err(|e| e.to_string())?;
+    write_file_atomic(&settings_path, &settings_bytes, false).map_err(|e| e.to_string())?;
     
     log::info!("设置保存成功");
     Ok(())
@@ -240,10 +271,10 @@ async fn load_settings(app_handle: tauri::AppHandle) -> Result<serde_json::Value
         }));
     }
     
-    let content = std::fs::read_to_string(&settings_path).map_err(|e| e.to_string())?;
-    let settings: serde_json::Value = serde_json::from_str(&content).map_err(|e| e.to_string())?;
+    let content = std::fs::read(&settings_path).map_err(|e| e.to_string())?;
+    let settings: serde_json::Value = serde_json::from_slice(&content).map_err(|e| e.to_string())?;
     
-    log::info!("加载的设置: {}", settings);
+    log::debug!("加载的设置: {}", settings);
     Ok(settings)
 }
 
@@ -257,24 +288,29 @@ async fn save_json_file(file_path: String, data: String) -> Result<(), String> {
     let current_dir = std::env::current_dir().map_err(|e| e.to_string())?;
     let full_path = current_dir.join(&file_path);
     
-    // 确保目录存在
-    if let Some(parent) = full_path.parent() {
-        std::fs::create_dir_all(parent).map_err(|e| {
-            let error = format!("创建目录失败: {}", e);
+    // 文件写入是阻塞操作，放到阻塞线程池中执行，大文件写入期间不占用异步运行时的工作线程
+    tauri::async_runtime::spawn_blocking(move || -> Result<(), String> {
+        // 确保目录存在
+        if let Some(parent) = full_path.parent() {
+            std::fs::create_dir_all(parent).map_err(|e| {
+                let error = format!("创建目录失败: {}", e);
+                log::error!("{}", error);
+                error
+            })?;
+        }
+        
+        // 写入文件
+        write_file_atomic(&full_path, data.as_bytes(), false).map_err(|e| {
+            let error = format!("写入JSON文件失败: {}", e);
             log::error!("{}", error);
-            error
+            error.to_string()
         })?;
-    }
-    
-    // 写入文件
-    std::fs::write(&full_path, data).map_err(|e| {
-        let error = format!("写入JSON文件失败: {}", e);
-        log::error!("{}", error);
-        error.to_string()
-    })?;
-    
-    log::info!("JSON文件保存成功: {:?}", full_path);
-    Ok(())
+        
+        log::info!("JSON文件保存成功: {:?}", full_path);
+        Ok(())
+    })
+    .await
+    .map_err(|e| format!("写入JSON文件失败: {}", e))?
 }
 
 // 加载JSON文件
@@ -300,6 +336,32 @@ async fn load_json_file(file_path: String) -> Result<String, String> {
     Ok(content)
 }
 
+// 加载并解析JSON文件，直接返回解析后的数据
+// 按字节读取后由serde_json解析，前端无需再对整段文本做一次JSON.parse；文件不存在时返回null
+#[tauri::command]
+async fn load_json_value(file_path: String) -> Result<serde_json::Value, String> {
+    let current_dir = std::env::current_dir().map_err(|e| e.to_string())?;
+    let full_path = current_dir.join(&file_path);
+    
+    let content = match std::fs::read(&full_path) {
+        Ok(content) => content,
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => return Ok(serde_json::Value::Null),
+        Err(e) => {
+            let error = format!("读取JSON文件失败: {}", e);
+            log::error!("{}", error);
+            return Err(error);
+        }
+    };
+    
+    let value: serde_json::Value = serde_json::from_slice(&content).map_err(|e| {
+        let error = format!("解析JSON文件失败: {:?}: {}", full_path, e);
+        log::error!("{}", error);
+        error
+    })?;
+    
+    Ok(value)
+}
+
 // 检查文件是否存在
 #[tauri::command]
 async fn file_exists(file_path: String) -> Result<bool, String> {
@@ -428,10 +490,28 @@ async fn get_app_info() -> Result<serde_json::Value, String> {
 
 // === 历史记录管理API ===
 
+// 历史任务文件内容，借用任务数据直接序列化，不再为外层对象深拷贝整个任务
+#[derive(Serialize)]
+struct HistoryTaskFile<'a> {
+    #[serde(rename = "task-data")]
+    task_data: &'a serde_json::Value,
+    #[serde(rename = "created-time")]
+    created_time: String,
+    year: i32,
+    month: u32,
+}
+
 // 保存历史任务到分年月文件夹结构
+// 文件写入和索引更新都是阻塞操作，放到阻塞线程池中执行，导出较大的结果时不占用异步运行时的工作线程
 #[tauri::command]
 async fn save_history_task(task_data: serde_json::Value) -> Result<(), String> {
-    log::info!("保存历史任务: {}", task_data);
+    tauri::async_runtime::spawn_blocking(move || write_history_task(&task_data))
+        .await
+        .map_err(|e| format!("保存历史任务失败: {}", e))?
+}
+
+fn write_history_task(task_data: &serde_json::Value) -> Result<(), String> {
+    log::debug!("保存历史任务: {}", task_data);
     
     // 解析任务数据
     let task_id = task_data.get("id")
@@ -443,6 +523,7 @@ async fn save_history_task(task_data: serde_json::Value) -> Result<(), String> {
     let timestamp = task_data.get("timestamp")
         .and_then(|v| v.as_str())
         .ok_or("缺少时间戳")?;
+    log::info!("保存历史任务: {} ({})", task_name, task_id);
     
     // 解析年月信息
     let datetime = chrono::DateTime::parse_from_rfc3339(timestamp)
@@ -474,17 +555,18 @@ async fn save_history_task(task_data: serde_json::Value) -> Result<(), String> {
     
     // 保存任务文件
     let file_path = month_dir.join(&file_name);
-    let task_file_data = serde_json::json!({
-        "task-data": task_data,
-        "created-time": chrono::Utc::now().to_rfc3339(),
-        "year": year,
-        "month": month
-    });
+    let task_file_data = HistoryTaskFile {
+        task_data,
+        created_time: chrono::Utc::now().to_rfc3339(),
+        year,
+        month,
+    };
     
-    let task_file_content = serde_json::to_string_pretty(&task_file_data)
+    // 任务文件只由程序读取，使用紧凑格式：结果很多时省去每个结果的换行和缩进
+    let task_file_content = serde_json::to_vec(&task_file_data)
         .map_err(|e| format!("序列化任务数据失败: {}", e))?;
     
-    std::fs::write(&file_path, task_file_content).map_err(|e| {
+    write_file_atomic(&file_path, &task_file_content, true).map_err(|e| {
         let error = format!("写入任务文件失败: {}", e);
         log::error!("{}", error);
         error
@@ -495,9 +577,9 @@ async fn save_history_task(task_data: serde_json::Value) -> Result<(), String> {
     // 更新history.json索引
     let history_index_path = current_dir.join("coredata").join("history.json");
     let mut history_index: Vec<serde_json::Value> = if history_index_path.exists() {
-        let content = std::fs::read_to_string(&history_index_path)
+        let content = std::fs::read(&history_index_path)
             .map_err(|e| format!("读取历史索引失败: {}", e))?;
-        serde_json::from_str(&content).unwrap_or_else(|_| vec![])
+        serde_json::from_slice(&content).unwrap_or_else(|_| vec![])
     } else {
         vec![]
     };
@@ -529,11 +611,11 @@ async fn save_history_task(task_data: serde_json::Value) -> Result<(), String> {
     // 保留最近100个记录
     history_index.truncate(100);
     
-    // 保存索引文件
-    let index_content = serde_json::to_string_pretty(&history_index)
+    // 保存索引文件（索引每次保存都会整体重写，使用紧凑格式）
+    let index_content = serde_json::to_vec(&history_index)
         .map_err(|e| format!("序列化索引失败: {}", e))?;
     
-    std::fs::write(&history_index_path, index_content).map_err(|e| {
+    write_file_atomic(&history_index_path, &index_content, true).map_err(|e| {
         let error = format!("保存历史索引失败: {}", e);
         log::error!("{}", error);
         error
@@ -557,10 +639,10 @@ async fn get_history_data() -> Result<Vec<serde_json::Value>, String> {
     }
     
     // 读取历史索引
-    let index_content = std::fs::read_to_string(&history_index_path)
+    let index_content = std::fs::read(&history_index_path)
         .map_err(|e| format!("读取历史索引失败: {}", e))?;
     
-    let history_index: Vec<serde_json::Value> = serde_json::from_str(&index_content)
+    let history_index: Vec<serde_json::Value> = serde_json::from_slice(&index_content)
         .unwrap_or_else(|_| vec![]);
     
     log::info!("从索引加载了 {} 条历史记录", history_index.len());
@@ -573,9 +655,9 @@ async fn get_history_data() -> Result<Vec<serde_json::Value>, String> {
             let task_file_path = current_dir.join("coredata").join("history").join(relative_path);
             
             if task_file_path.exists() {
-                match std::fs::read_to_string(&task_file_path) {
+                match std::fs::read(&task_file_path) {
                     Ok(task_content) => {
-                        if let Ok(task_file_data) = serde_json::from_str::<serde_json::Value>(&task_content) {
+                        if let Ok(task_file_data) = serde_json::from_slice::<serde_json::Value>(&task_content) {
                             if let Some(task_data) = task_file_data.get("task-data") {
                                 history_data.push(task_data.clone());
                                 continue;
@@ -621,10 +703,10 @@ async fn get_history_task(task_id: String) -> Result<Option<serde_json::Value>,
     }
     
     // 读取历史索引
-    let index_content = std::fs::read_to_string(&history_index_path)
+    let index_content = std::fs::read(&history_index_path)
         .map_err(|e| format!("读取历史索引失败: {}", e))?;
     
-    let history_index: Vec<serde_json::Value> = serde_json::from_str(&index_content)
+    let history_index: Vec<serde_json::Value> = serde_json::from_slice(&index_content)
         .unwrap_or_else(|_| vec![]);
     
     // 查找指定任务
@@ -635,10 +717,10 @@ async fn get_history_task(task_id: String) -> Result<Option<serde_json::Value>,
             let task_file_path = current_dir.join("coredata").join("history").join(relative_path);
             
             if task_file_path.exists() {
-                let task_content = std::fs::read_to_string(&task_file_path)
+                let task_content = std::fs::read(&task_file_path)
                     .map_err(|e| format!("读取任务文件失败: {}", e))?;
                 
-                if let Ok(task_file_data) = serde_json::from_str::<serde_json::Value>(&task_content) {
+                if let Ok(task_file_data) = serde_json::from_slice::<serde_json::Value>(&task_content) {
                     if let Some(task_data) = task_file_data.get("task-data") {
                         log::info!("成功加载历史任务: {}", task_id);
                         return Ok(Some(task_data.clone()));
@@ -665,10 +747,10 @@ async fn delete_history_task(task_id: String) -> Result<(), String> {
     }
     
     // 读取历史索引
-    let index_content = std::fs::read_to_string(&history_index_path)
+    let index_content = std::fs::read(&history_index_path)
         .map_err(|e| format!("读取历史索引失败: {}", e))?;
     
-    let mut history_index: Vec<serde_json::Value> = serde_json::from_str(&index_content)
+    let mut history_index: Vec<serde_json::Value> = serde_json::from_slice(&index_content)
         .unwrap_or_else(|_| vec![]);
     
     // 查找并删除任务文件
@@ -693,10 +775,10 @@ async fn delete_history_task(task_id: String) -> Result<(), String> {
     });
     
     // 保存更新后的索引
-    let index_content = serde_json::to_string_pretty(&history_index)
+    let index_content = serde_json::to_vec(&history_index)
         .map_err(|e| format!("序列化索引失败: {}", e))?;
     
-    std::fs::write(&history_index_path, index_content).map_err(|e| {
+    write_file_atomic(&history_index_path, &index_content, true).map_err(|e| {
         format!("保存历史索引失败: {}", e)
     })?;
     
@@ -743,10 +825,10 @@ async fn clear_history_data() -> Result<(), String> {
     
     // 清空索引文件
     let history_index_path = current_dir.join("coredata").join("history.json");
-    let empty_index = serde_json::to_string_pretty(&serde_json::Value::Array(vec![]))
+    let empty_index = serde_json::to_vec(&serde_json::Value::Array(vec![]))
         .map_err(|e| format!("序列化空索引失败: {}", e))?;
     
-    std::fs::write(&history_index_path, empty_index).map_err(|e| {
+    write_file_atomic(&history_index_path, &empty_index, true).map_err(|e| {
         format!("保存空索引失败: {}", e)
     })?;
     
@@ -772,10 +854,10 @@ async fn get_history_stats() -> Result<serde_json::Value, String> {
     }
     
     // 读取历史索引
-    let index_content = std::fs::read_to_string(&history_index_path)
+    let index_content = std::fs::read(&history_index_path)
         .map_err(|e| format!("读取历史索引失败: {}", e))?;
     
-    let history_index: Vec<serde_json::Value> = serde_json::from_str(&index_content)
+    let history_index: Vec<serde_json::Value> = serde_json::from_slice(&index_content)
         .unwrap_or_else(|_| vec![]);
     
     let mut total_results = 0;
@@ -818,10 +900,12 @@ async fn get_history_stats() -> Result<serde_json::Value, String> {
 }
 
 fn main() {
-    // 初始化日志系统
-    if let Err(e) = init_logging() {
-        eprintln!("日志系统初始化失败: {}", e);
-    }
+    // 初始化日志系统（在后台线程写入，不阻塞窗口创建）
+    std::thread::spawn(|| {
+        if let Err(e) = init_logging() {
+            eprintln!("日志系统初始化失败: {}", e);
+        }
+    });
 
     tauri::Builder::default()
         .plugin(tauri_plugin_shell::init())
@@ -844,6 +928,7 @@ fn main() {
             load_settings,
             save_json_file,
             load_json_file,
+            load_json_value,
             file_exists,
             delete_file,
             get_file_size,
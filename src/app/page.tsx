@@ -1,14 +1,11 @@
 'use client'
 
-import React, { useState, useRef, useCallback, useEffect, useMemo, memo } from 'react'
+import React, { useState, useRef, useCallback, useEffect, useMemo, memo, useSyncExternalStore } from 'react'
 import { Upload, Settings, Shuffle, X, FileText, Users, ChevronRight, ChevronUp, ChevronDown, Edit, Save, RotateCcw, Trash2, Bug, Trash, Shield, Moon, Sun, Smartphone, Monitor, MonitorSpeaker, Download, FileUp, AlertTriangle, Dice6, Lock, FileDown, History, Clock, ArrowUpDown, GraduationCap, Globe } from 'lucide-react'
-import { listen } from '@tauri-apps/api/event'
 import { ToastManager } from '@/components/ui/toast'
 import { useConfirmDialog } from '@/components/ui/confirm-dialog'
 import { useToast } from '@/hooks/useToast'
-import { testTauriConnection } from '@/lib/tauri'
-import { getAllSettings } from '@/lib/officialStore'
-import { encryptPassword, verifyPassword, isPasswordEncrypted } from '@/lib/crypto'
+import { debugLog, sortByTimestampDesc } from '@/lib/utils'
 
 
 // 优化的Button组件
@@ -131,9 +128,10 @@ class LotteryEngine {
   private weights: number[] = []
   private excludedIndices: Set<number> = new Set()
 
+  // 名单和权重在引擎内只读，直接引用传入的数组（小组数据和解析缓存中的数组都不会被原地修改），不再每次加载都复制一份
   loadData(names: string[], weights?: number[]) {
-    this.names = [...names]
-    this.weights = weights ? [...weights] : new Array(names.length).fill(1)
+    this.names = names
+    this.weights = weights ?? new Array(names.length).fill(1)
     this.excludedIndices.clear()
   }
 
@@ -175,13 +173,48 @@ class LotteryEngine {
   }
 
   // 新增：多人抽奖方法
+  // 候选列表和总权重只构建一次，之后每抽出一人就交换删除并扣减权重，避免每次抽取都重新扫描整个名单
   drawMultiple(count: number, useWeight = true, allowRepeat = false): string[] {
     const results: string[] = []
+    const availableIndices: number[] = []
+    let totalWeight = 0
+    // 剩余候选中权重大于0的人数：逐次扣减totalWeight会留下浮点残差（如权重0.1、0.2抽完后剩2.8e-17），
+    // 不能用totalWeight > 0判断是否还有有权重的候选，改为按人数判断，与drawOne中totalWeight === 0的含义一致
+    let positiveWeightCount = 0
+
+    for (let i = 0; i < this.names.length; i++) {
+      if (allowRepeat || !this.excludedIndices.has(i)) {
+        availableIndices.push(i)
+        totalWeight += this.weights[i]
+        if (this.weights[i] > 0) positiveWeightCount++
+      }
+    }
     
-    for (let i = 0; i < count; i++) {
-      const result = this.drawOne(useWeight, allowRepeat)
-      if (result === null) break // 没有更多可抽取的人员
-      results.push(result)
+    for (let n = 0; n < count && availableIndices.length > 0; n++) {
+      let position: number
+
+      if (useWeight && positiveWeightCount > 0) {
+        let random = Math.random() * totalWeight
+        position = 0
+        
+        while (random > this.weights[availableIndices[position]] && position < availableIndices.length - 1) {
+          random -= this.weights[availableIndices[position]]
+          position++
+        }
+      } else {
+        position = Math.floor(Math.random() * availableIndices.length)
+      }
+
+      const selectedIndex = availableIndices[position]
+      results.push(this.names[selectedIndex])
+
+      if (!allowRepeat) {
+        this.excludedIndices.add(selectedIndex)
+        totalWeight -= this.weights[selectedIndex]
+        if (this.weights[selectedIndex] > 0) positiveWeightCount--
+        availableIndices[position] = availableIndices[availableIndices.length - 1]
+        availableIndices.pop()
+      }
     }
     
     return results
@@ -200,78 +233,113 @@ class LotteryEngine {
   }
 }
 
-// 文件解析函数（保持不变）
-const parseFile = (file: File): Promise<{ names: string[], weights: number[] }> => {
-  return new Promise((resolve, reject) => {
-    const reader = new FileReader()
-    
-    reader.onload = (e) => {
-      const content = e.target?.result as string
-      const extension = file.name.split('.').pop()?.toLowerCase()
+// 预编译的行解析正则：一次匹配同时取出名称和权重
+// CSV：逗号分隔，字段两端去空白；TXT：空白或逗号分隔
+const CSV_LINE_RE = /^\s*([^,]*?)\s*(?:,\s*([^,]*?)\s*)?(?:,|$)/
+const TXT_LINE_RE = /^\s*([^\s,]+)(?:[\s,]+([^\s,]+))?/
 
-      try {
-        let names: string[] = []
-        let weights: number[] = []
-
-        if (extension === 'csv') {
-          const lines = content.trim().split('\n')
-          lines.forEach(line => {
-            const parts = line.split(',').map(part => part.trim())
-            if (parts[0]) {
-              names.push(parts[0])
-              const weight = parts[1] ? parseFloat(parts[1]) : 1
-              weights.push(isNaN(weight) ? 1 : Math.max(0, weight))
-            }
-          })
-        } else if (extension === 'txt') {
-          const lines = content.trim().split('\n')
-          lines.forEach(line => {
-            const parts = line.trim().split(/[\s,\t]+/)
-            if (parts[0]) {
-              names.push(parts[0])
-              const weight = parts[1] ? parseFloat(parts[1]) : 1
-              weights.push(isNaN(weight) ? 1 : Math.max(0, weight))
-            }
-          })
-        } else if (extension === 'json') {
-          const data = JSON.parse(content)
-          if (Array.isArray(data)) {
-            names = data.map(item => String(item))
-            weights = new Array(names.length).fill(1)
-          } else if (data.names && Array.isArray(data.names)) {
-            names = data.names.map((item: any) => String(item))
-            weights = data.weights && Array.isArray(data.weights) 
-              ? data.weights.map((w: any) => Math.max(0, parseFloat(w) || 1))
-              : new Array(names.length).fill(1)
-          }
-        }
+// 每解析这么多行让出一次主线程，避免大文件解析时界面卡死
+const PARSE_CHUNK_SIZE = 5000
 
-        if (names.length === 0) {
-          throw new Error('文件中没有找到有效的名称数据')
-        }
+const yieldToEventLoop = () => new Promise<void>(resolve => setTimeout(resolve, 0))
 
-        resolve({ names, weights })
-      } catch (error) {
-        reject(error)
-      }
-    }
-    
+// 读取文件文本内容
+const readFileText = (file: File): Promise<string> => {
+  return new Promise((resolve, reject) => {
+    const reader = new FileReader()
+    reader.onload = (e) => resolve(e.target?.result as string)
     reader.onerror = () => reject(new Error('文件读取失败'))
     reader.readAsText(file, 'UTF-8')
   })
 }
 
+// 将JSON中的名单数组转换为字符串数组：JSON.parse得到的数组归本次解析所有，
+// 全部元素已是字符串时（最常见的情况）直接使用，不再逐个String()生成新数组
+const toNameList = (items: any[]): string[] => {
+  for (let i = 0; i < items.length; i++) {
+    if (typeof items[i] !== 'string') return items.map(item => String(item))
+  }
+  return items
+}
+
+// 文件解析函数
+const readAndParseFile = async (file: File): Promise<{ names: string[], weights: number[] }> => {
+  const content = await readFileText(file)
+  const extension = file.name.split('.').pop()?.toLowerCase()
+
+  let names: string[] = []
+  let weights: number[] = []
+
+  if (extension === 'csv' || extension === 'txt') {
+    const lineRe = extension === 'csv' ? CSV_LINE_RE : TXT_LINE_RE
+    const text = content.trim()
+    // 逐行扫描文本，不预先拆分出完整的行数组，降低大文件的内存峰值
+    let lineStart = 0
+    let lineIndex = 0
+    while (lineStart <= text.length) {
+      let lineEnd = text.indexOf('\n', lineStart)
+      if (lineEnd === -1) lineEnd = text.length
+      if (lineIndex > 0 && lineIndex % PARSE_CHUNK_SIZE === 0) {
+        await yieldToEventLoop()
+      }
+      const match = lineRe.exec(text.slice(lineStart, lineEnd))
+      if (match && match[1]) {
+        names.push(match[1])
+        const weight = match[2] ? parseFloat(match[2]) : 1
+        weights.push(isNaN(weight) ? 1 : Math.max(0, weight))
+      }
+      lineStart = lineEnd + 1
+      lineIndex++
+    }
+  } else if (extension === 'json') {
+    const data = JSON.parse(content)
+    if (Array.isArray(data)) {
+      names = toNameList(data)
+      weights = new Array(names.length).fill(1)
+    } else if (data.names && Array.isArray(data.names)) {
+      names = toNameList(data.names)
+      weights = data.weights && Array.isArray(data.weights) 
+        ? data.weights.map((w: any) => Math.max(0, parseFloat(w) || 1))
+        : new Array(names.length).fill(1)
+    }
+  }
+
+  if (names.length === 0) {
+    throw new Error('文件中没有找到有效的名称数据')
+  }
+
+  return { names, weights }
+}
+
+// 解析结果缓存：按文件名、大小和修改时间识别同一文件，按最近使用顺序淘汰
+const PARSE_CACHE_LIMIT = 32
+const parseCache = new Map<string, { names: string[], weights: number[] }>()
+
+// 带缓存的文件解析，重复选择未修改的文件时不再重新读取和解析
+const parseFile = async (file: File): Promise<{ names: string[], weights: number[] }> => {
+  const cacheKey = `${file.name}|${file.size}|${file.lastModified}`
+  const cached = parseCache.get(cacheKey)
+  if (cached) {
+    parseCache.delete(cacheKey)
+    parseCache.set(cacheKey, cached)
+    return cached
+  }
+
+  const parsed = await readAndParseFile(file)
+  parseCache.set(cacheKey, parsed)
+  if (parseCache.size > PARSE_CACHE_LIMIT) {
+    parseCache.delete(parseCache.keys().next().value as string)
+  }
+  return parsed
+}
+
 // 文件信息组件（拆分出来的组件）
 const FileInfoDisplay = memo(({ currentFile, names, engineRef, allowRepeat, refreshTrigger }: any) => {
-  const [remainingCount, setRemainingCount] = useState(0)
-  
-  // 实时更新剩余人数
-  useEffect(() => {
-    if (engineRef.current && names.length > 0) {
-      const remaining = engineRef.current.getRemainingCount()
-      setRemainingCount(remaining)
-    }
-  }, [engineRef, names, allowRepeat, refreshTrigger])
+  // 实时计算剩余人数（渲染时直接得出，不再通过effect回写状态触发第二次渲染）
+  const remainingCount = useMemo(() => 
+    engineRef.current && names.length > 0 ? engineRef.current.getRemainingCount() : 0,
+    [engineRef, names, allowRepeat, refreshTrigger]
+  )
   
   if (!currentFile) return null
   
@@ -299,10 +367,313 @@ const FileInfoDisplay = memo(({ currentFile, names, engineRef, allowRepeat, refr
   )
 })
 
+// 滚动动画中的名称存放在组件外部，每帧只通知订阅它的RollingName，
+// 不必让整个页面组件随动画逐帧重新渲染
+const rollingNameStore = (() => {
+  let value = ''
+  const listeners = new Set<() => void>()
+  return {
+    get: () => value,
+    set: (next: string) => {
+      if (next === value) return
+      value = next
+      listeners.forEach(listener => listener())
+    },
+    subscribe: (listener: () => void) => {
+      listeners.add(listener)
+      return () => {
+        listeners.delete(listener)
+      }
+    }
+  }
+})()
+
+const RollingName = memo(() => {
+  const rollingName = useSyncExternalStore(rollingNameStore.subscribe, rollingNameStore.get, rollingNameStore.get)
+  return <>{rollingName || '...'}</>
+})
+
+// 历史任务列表项的样式类名只拼接一次，渲染时按选中状态直接取用
+const HISTORY_TASK_ITEM_CLASS = 'p-3 rounded-lg border cursor-pointer transition-colors border-gray-600 bg-gray-700/50 hover:bg-gray-700'
+const HISTORY_TASK_ITEM_SELECTED_CLASS = 'p-3 rounded-lg border cursor-pointer transition-colors border-blue-500 bg-blue-500/10'
+
+// 历史任务列表项（拆分出来的组件）：切换选中或增删任务时只有发生变化的行重新渲染；
+// 小组和人数合成为单个文本节点，不再为每行生成四个相邻的文本节点
+const HistoryTaskItem = memo(({ task, isSelected, onSelect }: any) => (
+  <div
+    onClick={() => {
+      // 重复点击当前任务时不重新加载，避免详情区整体重建
+      if (!isSelected) onSelect(task.id)
+    }}
+    className={isSelected ? HISTORY_TASK_ITEM_SELECTED_CLASS : HISTORY_TASK_ITEM_CLASS}
+  >
+    <div className="font-medium text-white text-sm">{task.name}</div>
+    <div className="text-xs text-gray-400 mt-1">
+      {formatTaskTime(task.timestamp)}
+    </div>
+    <div className="text-xs text-gray-500 mt-1">
+      {`${task.group_name} • ${task.total_count} 人`}
+    </div>
+  </div>
+))
+
+// 历史详情的结果列表（拆分出来的组件）：只随所选任务的结果变化而更新，
+// 搜索、编辑等其他状态变化时不会重建；切换任务时复用已有的行节点，只更新文本
+const HistoryResultList = memo(({ results }: any) => {
+  // 每行合成为单个文本节点
+  const rows = useMemo(() =>
+    (results ?? []).map((result: string, i: number) => (
+      <div key={i} className="p-2 bg-gray-700/30 rounded text-sm text-gray-300" style={offscreenRowStyle}>
+        {`${i + 1}. ${result}`}
+      </div>
+    )),
+    [results]
+  )
+
+  // 结果很多时分批挂载：先显示第一批，之后每个宏任务追加一批，批次之间浏览器可以响应输入和绘制，
+  // 选中结果很多的任务时对话框不会卡住；切换任务时从第一批重新开始。分批进度只重新渲染本组件
+  const [progress, setProgress] = useState<{ rows: any[], limit: number }>({ rows: [], limit: 0 })
+  const limit = progress.rows === rows ? progress.limit : HISTORY_RESULT_CHUNK_SIZE
+  useEffect(() => {
+    if (limit >= rows.length) return
+    const timer = setTimeout(() => {
+      setProgress({ rows, limit: limit + HISTORY_RESULT_CHUNK_SIZE })
+    }, 0)
+    return () => clearTimeout(timer)
+  }, [rows, limit])
+
+  return (
+    <div className="grid grid-cols-1 gap-2">
+      {limit >= rows.length ? rows : rows.slice(0, limit)}
+    </div>
+  )
+})
+
+// 运行环境和浏览器名称在运行期间不会变化，首次在客户端读取后缓存，关于页面重新渲染时不再重复检测和匹配userAgent
+let runtimeInfo: { runtime: string, browser: string } | null = null
+const getRuntimeInfo = () => {
+  if (runtimeInfo) return runtimeInfo
+  const info = {
+    runtime: typeof window !== 'undefined' && (window as any).__TAURI__ ? 'Tauri App' : 'Web Browser',
+    browser: typeof navigator !== 'undefined' ? navigator.userAgent.match(/Chrome|Firefox|Safari|Edge/)?.[0] || 'Unknown' : 'N/A'
+  }
+  // 服务端预渲染时没有window，结果不缓存
+  if (typeof window !== 'undefined') runtimeInfo = info
+  return info
+}
+
+// 关于页面（拆分出来的组件）：内容几乎全是静态的，只随主题和存储方式变化，
+// 设置对话框因其他状态重新渲染时不再重建整棵关于页面的元素树
+const AboutPanel = memo(({ theme, storageMethod }: any) => (
+  <div className="space-y-8">
+    <div className="border-b border-gray-700 pb-4">
+      <h3 className="text-xl font-semibold text-white mb-2">关于 StarRandom</h3>
+      <p className="text-gray-400 text-sm">现代化的抽奖系统 - 简单、快速、公平</p>
+    </div>
+
+    {/* 应用信息 */}
+    <div className="bg-gray-800/50 rounded-lg p-6 space-y-6">
+      <div className="flex items-center gap-4">
+        <div className="w-16 h-16 rounded-xl overflow-hidden">
+          <img src="/icon.png" alt="StarRandom" width={64} height={64} decoding="async" className="w-full h-full object-cover" />
+        </div>
+        <div>
+          <h4 className="text-2xl font-bold text-white">StarRandom</h4>
+          <p className="text-gray-400">现代化抽奖系统</p>
+        </div>
+      </div>
+
+      <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
+        <div className="space-y-3">
+          <div className="flex justify-between items-center">
+            <span className="text-gray-300">版本号：</span>
+            <span className="text-blue-400 font-mono">v1.0.7</span>
+          </div>
+          <div className="flex justify-between items-center">
+            <span className="text-gray-300">构建日期：</span>
+            <span className="text-gray-400 font-mono">2025-06-29</span>
+          </div>
+          <div className="flex justify-between items-center">
+            <span className="text-gray-300">运行环境：</span>
+            <span className="text-gray-400">
+              {getRuntimeInfo().runtime}
+            </span>
+          </div>
+        </div>
+
+        <div className="space-y-3">
+          <div className="flex justify-between items-center">
+            <span className="text-gray-300">技术栈：</span>
+            <span className="text-gray-400">React + TypeScript</span>
+          </div>
+          <div className="flex justify-between items-center">
+            <span className="text-gray-300">UI 框架：</span>
+            <span className="text-gray-400">Tailwind CSS</span>
+          </div>
+          <div className="flex justify-between items-center">
+            <span className="text-gray-300">桌面框架：</span>
+            <span className="text-gray-400">Tauri</span>
+          </div>
+        </div>
+      </div>
+    </div>
+
+    {/* 功能特性 */}
+    <div className="bg-gray-800/50 rounded-lg p-6 space-y-4">
+      <h4 className="text-lg font-medium text-gray-200 flex items-center gap-2">
+        <span className="text-yellow-400">⭐</span>
+        核心特性
+      </h4>
+      <div className="grid grid-cols-1 md:grid-cols-2 gap-4">
+        <div className="flex items-start gap-3 p-3 bg-gray-700/30 rounded-lg">
+          <div className="w-2 h-2 bg-green-400 rounded-full mt-2"></div>
+          <div>
+            <h5 className="text-gray-200 font-medium">多种抽奖模式</h5>
+            <p className="text-sm text-gray-400 mt-1">支持等概率和权重抽奖</p>
+          </div>
+        </div>
+        <div className="flex items-start gap-3 p-3 bg-gray-700/30 rounded-lg">
+          <div className="w-2 h-2 bg-blue-400 rounded-full mt-2"></div>
+          <div>
+            <h5 className="text-gray-200 font-medium">小组管理</h5>
+            <p className="text-sm text-gray-400 mt-1">创建和管理多个抽奖小组</p>
+          </div>
+        </div>
+        <div className="flex items-start gap-3 p-3 bg-gray-700/30 rounded-lg">
+          <div className="w-2 h-2 bg-purple-400 rounded-full mt-2"></div>
+          <div>
+            <h5 className="text-gray-200 font-medium">历史记录</h5>
+            <p className="text-sm text-gray-400 mt-1">完整的抽奖历史和结果管理</p>
+          </div>
+        </div>
+        <div className="flex items-start gap-3 p-3 bg-gray-700/30 rounded-lg">
+          <div className="w-2 h-2 bg-orange-400 rounded-full mt-2"></div>
+          <div>
+            <h5 className="text-gray-200 font-medium">数据安全</h5>
+            <p className="text-sm text-gray-400 mt-1">密码保护和数据备份</p>
+          </div>
+        </div>
+        <div className="flex items-start gap-3 p-3 bg-gray-700/30 rounded-lg">
+          <div className="w-2 h-2 bg-red-400 rounded-full mt-2"></div>
+          <div>
+            <h5 className="text-gray-200 font-medium">多格式支持</h5>
+            <p className="text-sm text-gray-400 mt-1">CSV、TXT、JSON 文件导入</p>
+          </div>
+        </div>
+        <div className="flex items-start gap-3 p-3 bg-gray-700/30 rounded-lg">
+          <div className="w-2 h-2 bg-teal-400 rounded-full mt-2"></div>
+          <div>
+            <h5 className="text-gray-200 font-medium">跨平台</h5>
+            <p className="text-sm text-gray-400 mt-1">支持 Windows、macOS、Linux</p>
+          </div>
+        </div>
+      </div>
+    </div>
+
+    {/* 开发信息 */}
+    <div className="bg-gray-800/50 rounded-lg p-6 space-y-4">
+      <h4 className="text-lg font-medium text-gray-200 flex items-center gap-2">
+        <span className="text-blue-400">💻</span>
+        开发信息
+      </h4>
+      <div className="space-y-3">
+        <div className="flex items-center justify-between">
+          <span className="text-gray-300">开发者：</span>
+          <span className="text-gray-400">StarRandom Team</span>
+        </div>
+        <div className="flex items-center justify-between">
+          <span className="text-gray-300">开源协议：</span>
+          <span className="text-gray-400">GPL-V3.0</span>
+        </div>
+        <div className="flex items-center justify-between">
+          <span className="text-gray-300">项目地址：</span>
+          <a href="https://github.com/vistaminc/StarRandom" target="_blank" rel="noopener noreferrer" className="text-blue-400 hover:text-blue-300 transition-colors text-sm">
+            GitHub Repository
+          </a>
+        </div>
+      </div>
+    </div>
+
+    {/* 系统信息 */}
+    <div className="bg-gray-800/50 rounded-lg p-6 space-y-4">
+      <h4 className="text-lg font-medium text-gray-200 flex items-center gap-2">
+        <span className="text-green-400">🔧</span>
+        系统信息
+      </h4>
+      <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
+        <div className="space-y-3">
+          <div className="flex justify-between items-center">
+            <span className="text-gray-300">浏览器：</span>
+            <span className="text-gray-400 font-mono text-sm">
+              {getRuntimeInfo().browser}
+            </span>
+          </div>
+          <div className="flex justify-between items-center">
+            <span className="text-gray-300">分辨率：</span>
+            <span className="text-gray-400 font-mono text-sm">
+              {typeof window !== 'undefined' ? `${window.screen.width}×${window.screen.height}` : 'N/A'}
+            </span>
+          </div>
+        </div>
+        <div className="space-y-3">
+          <div className="flex justify-between items-center">
+            <span className="text-gray-300">当前主题：</span>
+            <span className="text-gray-400 capitalize">
+              {theme === 'dark' ? '暗色主题' : '亮色主题'}
+            </span>
+          </div>
+          <div className="flex justify-between items-center">
+            <span className="text-gray-300">存储方式：</span>
+            <span className="text-gray-400">
+              {storageMethod === 'tauriStore' ? 'Tauri Store' : 'Local Storage'}
+            </span>
+          </div>
+        </div>
+      </div>
+    </div>
+
+    {/* 智教合作项目 */}
+    <div className="bg-gray-800/50 rounded-lg p-6 space-y-4">
+      <h4 className="text-lg font-medium text-gray-200 flex items-center gap-2">
+        <span className="text-cyan-400">🤝</span>
+        智教合作项目
+      </h4>
+      <div className="space-y-3">
+        <div className="flex items-center justify-between p-3 bg-gray-700/30 rounded-lg">
+          <div>
+            <h5 className="text-gray-200 font-medium">Seewo-HugoAura</h5>
+            <p className="text-sm text-gray-400 mt-1">下一代希沃管家注入式修改/破解方案</p>
+          </div>
+          <a 
+            href="https://github.com/HugoAura/Seewo-HugoAura" 
+            target="_blank" 
+            rel="noopener noreferrer" 
+            className="text-cyan-400 hover:text-cyan-300 transition-colors text-sm px-3 py-1 border border-cyan-400 rounded-lg hover:bg-cyan-400/10"
+          >
+            访问项目
+          </a>
+        </div>
+      </div>
+    </div>
+
+    {/* 感谢信息 */}
+    <div className="bg-gradient-to-r from-purple-900/20 to-blue-900/20 border border-purple-600/30 rounded-lg p-6 text-center">
+      <h4 className="text-lg font-medium text-gray-200 mb-3">
+        <span className="text-purple-400">💝</span> 感谢使用 StarRandom
+      </h4>
+      <p className="text-gray-300 mb-4">
+        如果这个工具对您有帮助，欢迎给我们反馈和建议
+      </p>
+      <div className="flex justify-center gap-4 text-sm">
+        <span className="text-gray-400">版权所有 © 2025 StarRandom Team & 河南星熠寻光科技有限公司 & vistamin </span>
+      </div>
+    </div>
+  </div>
+))
+
 // 抽奖结果显示组件（拆分出来的组件）
 const LotteryResultDisplay = memo(({ 
   isDrawing, 
-  rollingName, 
   winners, 
   settings, 
   resetLottery, 
@@ -336,7 +707,7 @@ const LotteryResultDisplay = memo(({
             正在抽取中...
           </div>
           <div className="text-4xl font-bold filter blur-sm animate-pulse text-blue-400">
-            {rollingName || '...'}
+            <RollingName />
           </div>
         </div>
       </div>
@@ -362,22 +733,21 @@ const LotteryResultDisplay = memo(({
                 ? 'flex flex-wrap justify-center gap-8' 
                 : 'grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 gap-4'
             } mb-6`}>
-              {winners.map((winner: string, index: number) => (
-                settings.educationLayout ? (
-                  // 智教布局：只显示名字，无边框，横向排列
-                  <div key={index} className="text-center">
-                    <div className="text-6xl font-bold text-green-400">
+              {/* 布局在整个列表外判断一次，而不是在每个中奖者上重复判断 */}
+              {settings.educationLayout
+                ? winners.map((winner: string, index: number) => (
+                    // 智教布局：只显示名字，无边框，横向排列
+                    <div key={index} className="text-center text-6xl font-bold text-green-400">
                       {winner}
                     </div>
-                  </div>
-                ) : (
-                  // 普通布局：带边框的卡片
-                  <div key={index} className="bg-gray-700/50 rounded-lg p-4 border border-green-400/30">
-                    <div className="text-sm text-gray-400 mb-1">第 {index + 1} 名</div>
-                    <div className="text-2xl font-bold text-green-400">{winner}</div>
-                  </div>
-                )
-              ))}
+                  ))
+                : winners.map((winner: string, index: number) => (
+                    // 普通布局：带边框的卡片
+                    <div key={index} className="bg-gray-700/50 rounded-lg p-4 border border-green-400/30">
+                      <div className="text-sm text-gray-400 mb-1">第 {index + 1} 名</div>
+                      <div className="text-2xl font-bold text-green-400">{winner}</div>
+                    </div>
+                  ))}
             </div>
           )}
           <div className="flex justify-center gap-4">
@@ -424,9 +794,12 @@ const DrawCountConfig = memo(({
     setDrawCount(Math.min(Math.max(1, value), maxValue))
   }, [setDrawCount, maxValue])
   
+  // 快捷按钮及其点击处理函数一起缓存，避免每次渲染创建新的回调导致Button重新渲染
   const quickButtons = useMemo(() => 
-    [1, 3, 5, 10].filter(num => allowRepeat || num <= names.length),
-    [allowRepeat, names.length]
+    [1, 3, 5, 10]
+      .filter(num => allowRepeat || num <= names.length)
+      .map(num => ({ num, onClick: () => setDrawCount(num) })),
+    [allowRepeat, names.length, setDrawCount]
   )
   
   const statusText = useMemo(() => 
@@ -484,10 +857,10 @@ const DrawCountConfig = memo(({
         {/* 快捷按钮 */}
         {names.length > 0 && (
           <div className="flex items-center gap-1">
-            {quickButtons.map(num => (
+            {quickButtons.map(({ num, onClick }) => (
               <Button
                 key={num}
-                onClick={() => setDrawCount(num)}
+                onClick={onClick}
                 variant={drawCount === num ? "default" : "outline"}
                 size="sm"
                 className={drawCount === num 
@@ -540,7 +913,8 @@ const ControlButtonsArea = memo(({
   exportResults, 
   setShowHistoryDialog, 
   setShowSettings,
-  showPasswordDialog // 新增密码验证对话框函数
+  showPasswordDialog, // 新增密码验证对话框函数
+  updateSetting
 }: any) => {
   const groupOptions = useMemo(() => 
     groups.map((group: any) => (
@@ -583,8 +957,13 @@ const ControlButtonsArea = memo(({
       showPasswordDialog({
         title: '密码验证',
         message: '请输入设置密码以进入设置界面：',
-        onConfirm: (inputPassword: string) => {
-          if (verifyPassword(inputPassword, settings.password)) {
+        onConfirm: async (inputPassword: string) => {
+          const { verifyPasswordHash, isPasswordHashed, hashPassword } = await import('@/lib/crypto')
+          if (await verifyPasswordHash(inputPassword, settings.password)) {
+            // 旧的可逆加密或明文密码验证通过后升级为PBKDF2哈希
+            if (!isPasswordHashed(settings.password)) {
+              updateSetting('password', await hashPassword(inputPassword))
+            }
             setShowSettings(true)
           } else {
             // 密码错误，显示错误提示
@@ -599,7 +978,7 @@ const ControlButtonsArea = memo(({
       // 未启用密码保护或未设置密码，直接打开设置
       setShowSettings(true)
     }
-  }, [settings.passwordProtection, settings.password, showPasswordDialog, setShowSettings])
+  }, [settings.passwordProtection, settings.password, showPasswordDialog, setShowSettings, updateSetting])
   
   return (
     <div className="flex flex-wrap items-center justify-center gap-4 mb-6">
@@ -675,6 +1054,125 @@ const ControlButtonsArea = memo(({
   )
 })
 
+// 历史任务时间的显示文本，与toLocaleString('zh-CN')格式一致；格式化器只创建一次，
+// 每个时间戳只解析和格式化一次，历史列表重新渲染时直接复用
+const taskTimeFormatter = new Intl.DateTimeFormat('zh-CN', {
+  year: 'numeric', month: 'numeric', day: 'numeric',
+  hour: 'numeric', minute: 'numeric', second: 'numeric'
+})
+const TASK_TIME_CACHE_LIMIT = 500
+const pad2 = (value: number): string => value < 10 ? `0${value}` : `${value}`
+const taskTimeCache = new Map<string, string>()
+const formatTaskTime = (timestamp: string): string => {
+  let formatted = taskTimeCache.get(timestamp)
+  if (formatted === undefined) {
+    const date = new Date(timestamp)
+    const year = date.getFullYear()
+    if (isNaN(year)) {
+      formatted = 'Invalid Date'
+    } else if (year >= 1000 && year <= 9999) {
+      // 常见年份直接按zh-CN的显示格式拼接（年/月/日 两位时:分:秒），不经过Intl格式化
+      formatted = `${year}/${date.getMonth() + 1}/${date.getDate()} ${pad2(date.getHours())}:${pad2(date.getMinutes())}:${pad2(date.getSeconds())}`
+    } else {
+      formatted = taskTimeFormatter.format(date)
+    }
+    if (taskTimeCache.size >= TASK_TIME_CACHE_LIMIT) {
+      taskTimeCache.clear()
+    }
+    taskTimeCache.set(timestamp, formatted)
+  }
+  return formatted
+}
+
+// 历史任务的搜索文本：名称、小组名和所有结果以换行连接后转为小写，每个任务对象只生成一次。
+// 搜索框输入不含换行，匹配结果与逐项比较相同；编辑任务会产生新对象，删除任务不影响其他任务的缓存
+const taskSearchTextCache = new WeakMap<object, string>()
+const getTaskSearchText = (task: any): string => {
+  let text = taskSearchTextCache.get(task)
+  if (text === undefined) {
+    text = [task.name, task.group_name, ...task.results].join('\n').toLowerCase()
+    taskSearchTextCache.set(task, text)
+  }
+  return text
+}
+
+// 历史详情结果每批挂载的行数
+const HISTORY_RESULT_CHUNK_SIZE = 200
+// 导出对话框中预览的结果行数
+const EXPORT_PREVIEW_LIMIT = 10
+
+// 长列表的行样式：不在可视区域内的行跳过布局和绘制，只按预估高度占位，
+// 历史结果很多时切换任务或调整窗口大小只需排版可见的行
+const offscreenRowStyle: React.CSSProperties = {
+  contentVisibility: 'auto',
+  containIntrinsicSize: 'auto 36px'
+}
+
+// 以浏览器绘制帧驱动滚动动画：帧回调直接挂在requestAnimationFrame上，整段动画只创建一个Promise，
+// 不必每帧新建Promise再恢复async函数；每隔interval毫秒才调用一次onUpdate，
+// 到达stopTime、shouldStop()为真或更新次数超过上限时结束
+const MAX_ROLL_UPDATES = 10000
+const runRollAnimation = (interval: number, stopTime: number, shouldStop: () => boolean, onUpdate: () => void) =>
+  new Promise<void>(resolve => {
+    let nextUpdateTime = -Infinity
+    let updates = 0
+    let finished = false
+    let stopTimer: ReturnType<typeof setTimeout> | null = null
+    const finish = () => {
+      if (finished) return
+      finished = true
+      if (stopTimer) clearTimeout(stopTimer)
+      resolve()
+    }
+    // 窗口最小化或隐藏时requestAnimationFrame不会触发，定时停止模式另用定时器保证按时结束
+    if (stopTime !== Infinity) {
+      stopTimer = setTimeout(finish, Math.max(0, stopTime - performance.now()))
+    }
+    const step = (now: number) => {
+      if (finished) return
+      if (shouldStop() || now >= stopTime) {
+        finish()
+        return
+      }
+      if (now >= nextUpdateTime) {
+        nextUpdateTime = now + interval
+        onUpdate()
+        // 防止无限循环导致性能问题，设置最大更新次数
+        if (++updates > MAX_ROLL_UPDATES) {
+          finish()
+          return
+        }
+      }
+      requestAnimationFrame(step)
+    }
+    requestAnimationFrame(step)
+  })
+
+// 滚动动画的随机下标来源：一次getRandomValues批量生成一组随机数，逐帧取用，用完再整体补充
+const ROLL_INDEX_BATCH_SIZE = 256
+const createRollIndexSource = (count: number) => {
+  const buffer = new Uint32Array(ROLL_INDEX_BATCH_SIZE)
+  let cursor = ROLL_INDEX_BATCH_SIZE
+  return () => {
+    if (cursor === ROLL_INDEX_BATCH_SIZE) {
+      crypto.getRandomValues(buffer)
+      cursor = 0
+    }
+    return buffer[cursor++] % count
+  }
+}
+
+// 将主题类应用到HTML根元素，已是目标主题时不做修改，避免触发整页样式重算
+const applyThemeClass = (theme: string) => {
+  const root = document.documentElement
+  const isLight = theme === 'light'
+  if (root.classList.contains(isLight ? 'light' : 'dark') && !root.classList.contains(isLight ? 'dark' : 'light')) {
+    return
+  }
+  root.classList.toggle('light', isLight)
+  root.classList.toggle('dark', !isLight)
+}
+
 export default function Home() {
   // 文件上传状态
   const [currentFile, setCurrentFile] = useState<string>('')
@@ -685,7 +1183,6 @@ export default function Home() {
   const [isDrawing, setIsDrawing] = useState(false)
   const [canStop, setCanStop] = useState(false)
   const [winners, setWinners] = useState<string[]>([])
-  const [rollingName, setRollingName] = useState<string>('')
   const [drawnResults, setDrawnResults] = useState<string[]>([])
 
   // 🔧 剩余人数刷新触发器
@@ -717,7 +1214,6 @@ export default function Home() {
   // 存储实例
 
 
-  const [winner, setWinner] = useState<string>('')
   const [drawCount, setDrawCount] = useState(() => {
     // 从localStorage加载抽奖人数
     try {
@@ -744,10 +1240,13 @@ export default function Home() {
   const [passwordDialogConfig, setPasswordDialogConfig] = useState<{
     title: string
     message: string
-    onConfirm: (password: string) => void
+    onConfirm: (password: string) => void | Promise<void>
     onCancel?: () => void
   } | null>(null)
   const [passwordInput, setPasswordInput] = useState('')
+  // 密码验证（PBKDF2派生）进行中，期间验证按钮显示加载状态并忽略重复提交
+  const [passwordVerifying, setPasswordVerifying] = useState(false)
+  const passwordVerifyingRef = useRef(false)
   
   // 小组管理状态
   const [groups, setGroups] = useState<Array<{
@@ -758,6 +1257,8 @@ export default function Home() {
     names: string[]
     weights: number[]
   }>>([])
+  // 按ID索引小组，避免每次查找都线性扫描
+  const groupsById = useMemo(() => new Map(groups.map(group => [group.id, group])), [groups])
   const [selectedGroupId, setSelectedGroupId] = useState<string>('')
   const [newGroupName, setNewGroupName] = useState<string>('')
   const [newGroupPath, setNewGroupPath] = useState<string>('')
@@ -777,19 +1278,37 @@ export default function Home() {
   const { showConfirm, ConfirmDialog } = useConfirmDialog()
   
   const fileInputRef = useRef<HTMLInputElement>(null)
+  // 文件上传序号，用于丢弃已被新上传取代的解析结果
+  const fileUploadIdRef = useRef(0)
+  // 历史详情加载序号，快速切换任务时丢弃过期的加载结果
+  const historyDetailLoadIdRef = useRef(0)
+  // 最新的历史任务列表，详情加载在列表变化时无需重建，列表项的选中回调保持稳定
+  const historyTasksRef = useRef(historyTasks)
+  historyTasksRef.current = historyTasks
 
   const engineRef = useRef(new LotteryEngine())
   // 使用ref来管理停止状态，确保在异步循环中能读取到最新值
   const isAnimationStoppedRef = useRef(false)
+  // 最新的抽奖人数，抽奖开始时读取一次快照，修改人数时无需重建startLottery
+  const drawCountRef = useRef(drawCount)
+  drawCountRef.current = drawCount
+  // 最新的设置，同样在抽奖开始时读取快照，切换主题等无关设置时不会重建startLottery及其下游组件
+  const settingsRef = useRef(settings)
+  settingsRef.current = settings
+  // 最后选择小组的延迟保存计时器，连续切换小组时只保存最终结果
+  const lastGroupSaveTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null)
+  // 刚从存储加载的小组数据，用于跳过把相同数据立即写回存储
+  const loadedGroupsRef = useRef<any[] | null>(null)
+  // 最近一次成功保存的设置快照，内容未变化时跳过重复写入存储
+  const lastSavedSettingsRef = useRef<string | null>(null)
+  // 旧格式编辑密码验证通过后生成的PBKDF2哈希，保存编辑结果时一并写回该任务
+  const upgradedEditPasswordRef = useRef<{ taskId: string, hash: string } | null>(null)
 
   // 优化: 使用useMemo缓存复杂计算
   const filteredHistoryTasks = useMemo(() => {
     if (!historySearchTerm.trim()) return historyTasks
-    return historyTasks.filter(task => 
-      task.name.toLowerCase().includes(historySearchTerm.toLowerCase()) ||
-      task.group_name.toLowerCase().includes(historySearchTerm.toLowerCase()) ||
-      task.results.some((result: string) => result.toLowerCase().includes(historySearchTerm.toLowerCase()))
-    )
+    const term = historySearchTerm.toLowerCase()
+    return historyTasks.filter(task => getTaskSearchText(task).includes(term))
   }, [historyTasks, historySearchTerm])
 
   // 保存抽奖人数到localStorage
@@ -808,14 +1327,18 @@ export default function Home() {
     const file = event.target.files?.[0]
     if (!file) return
 
+    // 解析过程中会让出主线程，期间可能又选择了其他文件，只应用最后一次选择的结果
+    const uploadId = ++fileUploadIdRef.current
+
     try {
       const { names: parsedNames, weights: parsedWeights } = await parseFile(file)
+      if (uploadId !== fileUploadIdRef.current) return
       setNames(parsedNames)
       setWeights(parsedWeights)
       setCurrentFile(file.name)
       engineRef.current.loadData(parsedNames, parsedWeights)
-      setWinner('')
     } catch (error) {
+      if (uploadId !== fileUploadIdRef.current) return
       showError(`文件解析失败: ${error}`)
     }
   }, [showError])
@@ -823,6 +1346,9 @@ export default function Home() {
   const [isAnimationStopped, setIsAnimationStopped] = useState(false)
 
   const startLottery = useCallback(async () => {
+    const drawCount = drawCountRef.current
+    const settings = settingsRef.current
+
     if (names.length === 0) {
       showWarning('请先选择小组或上传名单文件')
       return
@@ -839,7 +1365,6 @@ export default function Home() {
     }
 
     // 在开始新抽奖时重置上次结果
-    setWinner('')
     setWinners([])
     
     setIsDrawing(true)
@@ -850,37 +1375,23 @@ export default function Home() {
     // 简洁的滚动动画
     const animationDuration = settings.animationDuration
     const frameRate = 60
-    const frames = animationDuration / frameRate
 
     if (settings.useAnimation) {
       // 延迟一点时间再允许停止，避免误触
       setTimeout(() => setCanStop(true), 500)
       
-      if (settings.manualStopMode) {
-        // 手动停止模式：无限循环直到用户停止
-        let animationFrame = 0
-        while (!isAnimationStoppedRef.current) { // 使用ref来检查停止状态
-          const randomName = names[Math.floor(Math.random() * names.length)]
-          setRollingName(randomName)
-          await new Promise(resolve => setTimeout(resolve, frameRate))
-          animationFrame++
-          
-          // 防止无限循环导致性能问题，设置最大帧数
-          if (animationFrame > 10000) break
-        }
-      } else {
-        // 定时停止模式：按设定时间自动停止
-      for (let i = 0; i < frames; i++) {
-          // 检查是否被手动停止
-          if (isAnimationStoppedRef.current) { // 使用ref来检查停止状态
-            break
-          }
-          
-        const randomName = names[Math.floor(Math.random() * names.length)]
-        setRollingName(randomName)
-        await new Promise(resolve => setTimeout(resolve, frameRate))
-        }
-      }
+      // 以浏览器绘制帧驱动动画，每隔frameRate毫秒才更新一次名称，
+      // 更新与绘制对齐，不会在绘制较慢时堆积定时器回调
+      const nextRollIndex = createRollIndexSource(names.length)
+      // 定时停止模式：按设定时间自动停止；手动停止模式：无限循环直到用户停止
+      // 停止时刻在开始时算好一次，每帧只需与当前时间比较
+      const stopTime = settings.manualStopMode ? Infinity : performance.now() + animationDuration
+      await runRollAnimation(
+        frameRate,
+        stopTime,
+        () => isAnimationStoppedRef.current, // 使用ref来检查停止状态
+        () => rollingNameStore.set(names[nextRollIndex()])
+      )
     }
 
     setCanStop(false)
@@ -890,7 +1401,6 @@ export default function Home() {
       // 单人抽奖
       const result = engineRef.current.drawOne(drawMode === 'weighted', allowRepeat)
       if (result) {
-        setWinner(result)
         setWinners([result])
         
         // 添加到抽奖结果历史
@@ -900,7 +1410,6 @@ export default function Home() {
         if (settings.resetAfterDraw) {
           setTimeout(() => {
             engineRef.current.resetExclusions()
-            setWinner('') // 清空获奖者
             setWinners([]) // 清空获奖者列表
             setDrawnResults([]) // 清空抽奖结果历史
             setRemainingCountTrigger(prev => prev + 1) // 触发剩余人数更新
@@ -922,9 +1431,6 @@ export default function Home() {
       const results = engineRef.current.drawMultiple(drawCount, drawMode === 'weighted', allowRepeat)
       if (results.length > 0) {
         setWinners(results)
-        if (results.length === 1) {
-          setWinner(results[0])
-        }
         
         // 添加到抽奖结果历史
         setDrawnResults(prev => [...prev, ...results])
@@ -933,7 +1439,6 @@ export default function Home() {
         if (settings.resetAfterDraw) {
           setTimeout(() => {
             engineRef.current.resetExclusions()
-            setWinner('') // 清空获奖者
             setWinners([]) // 清空获奖者列表
             setDrawnResults([]) // 清空抽奖结果历史
             setRemainingCountTrigger(prev => prev + 1) // 触发剩余人数更新
@@ -956,8 +1461,8 @@ export default function Home() {
     setCanStop(false)
     setIsAnimationStopped(false)
     isAnimationStoppedRef.current = false // 重置ref状态
-    setRollingName('')
-  }, [names, drawCount, drawMode, allowRepeat, settings, showWarning, groups, selectedGroupId])
+    rollingNameStore.set('')
+  }, [names, drawMode, allowRepeat, showWarning])
 
   const stopLottery = useCallback(() => {
     setIsAnimationStopped(true)
@@ -966,7 +1471,6 @@ export default function Home() {
 
   const resetLottery = useCallback(() => {
     engineRef.current.resetExclusions()
-    setWinner('')
     setWinners([])
     setDrawnResults([]) // 清空抽奖结果历史
     setRemainingCountTrigger(prev => prev + 1) // 触发剩余人数更新
@@ -986,6 +1490,19 @@ export default function Home() {
   const [exportFormat, setExportFormat] = useState('.csv')
   const [enableEditProtection, setEnableEditProtection] = useState(false)
   const [editProtectionPassword, setEditProtectionPassword] = useState('')
+
+  // 导出预览行只随抽奖结果变化而重建，在导出对话框中输入文件名或密码时直接复用；每行合成为单个文本节点。
+  // 对话框关闭时不生成，连续抽奖时不会为看不到的预览重复构建
+  const exportPreviewRows = useMemo(() =>
+    showExportDialog
+      ? drawnResults.slice(0, EXPORT_PREVIEW_LIMIT).map((result, index) => (
+          <div key={index} className="text-sm text-gray-300 py-1 px-2 bg-gray-700/30 rounded">
+            {`${index + 1}. ${result}`}
+          </div>
+        ))
+      : null,
+    [drawnResults, showExportDialog]
+  )
   
   // 导出名单功能
   const exportResults = useCallback(() => {
@@ -1002,7 +1519,11 @@ export default function Home() {
 
   // 执行导出
   const performExport = useCallback(async () => {
-    if (!exportFileName.trim()) {
+    // 导出过程中反复用到的值先取到局部变量，后面各格式和历史记录直接复用
+    const trimmedFileName = exportFileName.trim()
+    const totalCount = drawnResults.length
+
+    if (!trimmedFileName) {
       showError('文件名不能为空')
       return
     }
@@ -1013,11 +1534,14 @@ export default function Home() {
       return
     }
 
-    let content = ''
-    let filename = exportFileName.trim()
+    // 按片段交给Blob的导出内容，各格式都不再拼接出完整的中间字符串
+    let blobParts: BlobPart[] = []
+    let filename = trimmedFileName
     let mimeType = ''
 
-    const currentTime = new Date().toLocaleString('zh-CN')
+    // 整次导出共用同一个时间点：文本头、JSON导出时间、历史任务的id和时间戳保持一致
+    const now = new Date()
+    const nowIso = now.toISOString()
 
     // 确保文件名有正确的扩展名
     if (!filename.endsWith(exportFormat)) {
@@ -1025,37 +1549,40 @@ export default function Home() {
     }
 
     if (exportFormat === '.csv') {
-      // CSV格式
-      content = '序号,抽奖结果\n'
+      // CSV格式：每行作为一个片段直接交给Blob，不再拼接出完整的中间字符串
+      const rows: string[] = new Array(totalCount + 1)
+      rows[0] = '序号,抽奖结果\n'
       drawnResults.forEach((result, index) => {
-        content += `${index + 1},"${result}"\n`
+        rows[index + 1] = `${index + 1},"${result}"\n`
       })
+      blobParts = rows
       mimeType = 'text/csv'
     } else if (exportFormat === '.txt') {
-      // 文本格式
-      content = `抽奖结果\n`
-      content += `任务名称: ${exportFileName}\n`
-      content += `导出时间: ${currentTime}\n`
-      content += `总人数: ${drawnResults.length}\n\n`
-      content += `抽奖结果列表:\n`
+      // 文本格式：与CSV相同，预分配行数组，每行自带换行符直接交给Blob，不再拼接出完整字符串
+      const header = `抽奖结果\n任务名称: ${exportFileName}\n导出时间: ${now.toLocaleString('zh-CN')}\n总人数: ${totalCount}\n\n抽奖结果列表:\n`
+      const lines: string[] = new Array(totalCount + 1)
+      lines[0] = header
       drawnResults.forEach((result, index) => {
-        content += `${index + 1}. ${result}\n`
+        lines[index + 1] = `${index + 1}. ${result}\n`
       })
+      blobParts = lines
       mimeType = 'text/plain'
     } else if (exportFormat === '.json') {
-      // JSON格式
-      const exportData = {
-        task_name: exportFileName,
-        export_time: new Date().toISOString(),
-        total_count: drawnResults.length,
-        results: drawnResults
-      }
-      content = JSON.stringify(exportData, null, 2)
+      // JSON格式：按两空格缩进的JSON.stringify排版逐个结果生成片段交给Blob，
+      // 输出与整体序列化{ task_name, export_time, total_count, results }完全相同，但不会生成完整的中间字符串
+      const parts: string[] = new Array(totalCount + 2)
+      parts[0] = `{\n  "task_name": ${JSON.stringify(exportFileName)},\n  "export_time": ${JSON.stringify(nowIso)},\n  "total_count": ${totalCount},\n  "results": [`
+      const lastIndex = totalCount - 1
+      drawnResults.forEach((result, index) => {
+        parts[index + 1] = index < lastIndex ? `\n    ${JSON.stringify(result)},` : `\n    ${JSON.stringify(result)}\n  `
+      })
+      parts[totalCount + 1] = ']\n}'
+      blobParts = parts
       mimeType = 'application/json'
     }
 
     // 创建下载链接
-    const blob = new Blob([content], { type: mimeType + ';charset=utf-8' })
+    const blob = new Blob(blobParts, { type: mimeType + ';charset=utf-8' })
     const url = URL.createObjectURL(blob)
     const link = document.createElement('a')
     link.href = url
@@ -1068,15 +1595,15 @@ export default function Home() {
 
     // 保存到历史任务
     const newTask = {
-      id: Date.now().toString(),
+      id: now.getTime().toString(),
       name: exportFileName,
-      timestamp: new Date().toISOString(),
+      timestamp: nowIso,
       results: drawnResults,
       file_path: filename,
-      total_count: drawnResults.length,
-      group_name: groups.find(g => g.id === selectedGroupId)?.name || '未知小组',
+      total_count: totalCount,
+      group_name: groupsById.get(selectedGroupId)?.name || '未知小组',
       edit_protected: enableEditProtection, // 使用用户设置
-      edit_password: enableEditProtection ? editProtectionPassword : '' // 只有启用保护时才保存密码
+      edit_password: enableEditProtection ? await (await import('@/lib/crypto')).hashPassword(editProtectionPassword) : '' // 只有启用保护时才保存密码哈希
     }
     
     const updatedHistory = [newTask, ...historyTasks.slice(0, 99)] // 保留最近100个任务
@@ -1107,8 +1634,8 @@ export default function Home() {
     setShowExportDialog(false)
     setEnableEditProtection(false)
     setEditProtectionPassword('')
-    showSuccess(`已成功导出 ${drawnResults.length} 个抽奖结果并保存到历史`)
-  }, [drawnResults, exportFileName, exportFormat, showError, showSuccess, enableEditProtection, editProtectionPassword, historyTasks, selectedGroupId, groups, settings.storageMethod])
+    showSuccess(`已成功导出 ${totalCount} 个抽奖结果并保存到历史`)
+  }, [drawnResults, exportFileName, exportFormat, showError, showSuccess, enableEditProtection, editProtectionPassword, historyTasks, selectedGroupId, groupsById])
 
   const updateSetting = useCallback((key: string, value: any) => {
     setSettings(prev => ({ ...prev, [key]: value }))
@@ -1157,8 +1684,8 @@ export default function Home() {
     showSuccess(`小组 "${newGroupName.trim()}" 添加成功`)
   }, [newGroupName, selectedFile, newGroupUrl, showError, showSuccess])
 
-  const selectGroup = useCallback((groupId: string) => {
-    const group = groups.find(g => g.id === groupId)
+  const selectGroup = useCallback((groupId: string, persist = true) => {
+    const group = groupsById.get(groupId)
     if (group) {
       setNames(group.names)
       setWeights(group.weights)
@@ -1167,10 +1694,17 @@ export default function Home() {
       engineRef.current.loadData(group.names, group.weights)
       // 不再清空获奖者信息，保持显示上次抽奖结果
       
-      // 🔧 保存最后选择的小组ID到localStorage
-      saveLastSelectedGroup(groupId)
+      // 🔧 保存最后选择的小组ID到localStorage（延迟合并，避免快速切换时每次都写入）
+      if (!persist) return
+      if (lastGroupSaveTimerRef.current) {
+        clearTimeout(lastGroupSaveTimerRef.current)
+      }
+      lastGroupSaveTimerRef.current = setTimeout(() => {
+        lastGroupSaveTimerRef.current = null
+        saveLastSelectedGroup(groupId)
+      }, 300)
     }
-  }, [groups])
+  }, [groupsById])
 
   // 🔧 保存最后选择的小组
   const saveLastSelectedGroup = useCallback(async (groupId: string) => {
@@ -1216,10 +1750,11 @@ export default function Home() {
       }
       
       if (lastGroupId && groups.length > 0) {
-        const group = groups.find(g => g.id === lastGroupId)
+        const group = groupsById.get(lastGroupId)
         if (group) {
           console.log('🔄 自动加载最后选择的小组:', group.name)
-          selectGroup(lastGroupId)
+          // 恢复选择时不再把刚读取的小组ID写回存储
+          selectGroup(lastGroupId, false)
           return true
         } else {
           console.log('⚠️ 最后选择的小组不存在，可能已被删除')
@@ -1231,10 +1766,10 @@ export default function Home() {
       console.error('加载最后选择小组失败:', error)
       return false
     }
-  }, [groups, selectGroup])
+  }, [groups, groupsById, selectGroup])
 
   const deleteGroup = useCallback((groupId: string) => {
-    const group = groups.find(g => g.id === groupId)
+    const group = groupsById.get(groupId)
     showConfirm({
       title: '确认删除',
       message: `确定要删除小组 "${group?.name}" 吗？此操作不可撤销。`,
@@ -1255,11 +1790,11 @@ export default function Home() {
         showSuccess('小组删除成功')
       }
     })
-  }, [selectedGroupId, selectedGroupForEdit, groups, showConfirm, showSuccess])
+  }, [selectedGroupId, selectedGroupForEdit, groupsById, showConfirm, showSuccess])
 
   // 小组编辑功能
   const selectGroupForEdit = useCallback((groupId: string) => {
-    const group = groups.find(g => g.id === groupId)
+    const group = groupsById.get(groupId)
     if (group) {
       setSelectedGroupForEdit(groupId)
       setEditingGroupName(group.name)
@@ -1267,7 +1802,7 @@ export default function Home() {
       setEditingGroupUrl(group.url)
       setEditingFile(null)
     }
-  }, [groups])
+  }, [groupsById])
 
   const clearEditForm = useCallback(() => {
     setSelectedGroupForEdit('')
@@ -1321,7 +1856,7 @@ export default function Home() {
     }
 
     // 如果有新URL，处理URL内容
-    if (editingGroupUrl.trim() && editingGroupUrl !== groups.find(g => g.id === selectedGroupForEdit)?.url) {
+    if (editingGroupUrl.trim() && editingGroupUrl !== groupsById.get(selectedGroupForEdit)?.url) {
       try {
         const response = await fetch(editingGroupUrl.trim())
         if (!response.ok) {
@@ -1332,7 +1867,8 @@ export default function Home() {
         const extension = editingGroupUrl.split('.').pop()?.toLowerCase()
         
         const mockFile = new File([content], `remote.${extension}`, { type: 'text/plain' })
-        const { names: parsedNames, weights: parsedWeights } = await parseFile(mockFile)
+        // 远程内容每次都重新获取，直接解析，不写入按文件缓存的解析结果
+        const { names: parsedNames, weights: parsedWeights } = await readAndParseFile(mockFile)
         
         setGroups(prev => prev.map(g => 
           g.id === selectedGroupForEdit 
@@ -1347,7 +1883,7 @@ export default function Home() {
 
           showSuccess('小组更新成功')
       clearEditForm()
-    }, [selectedGroupForEdit, editingGroupName, editingGroupPath, editingGroupUrl, editingFile, groups, clearEditForm, showSuccess, showError])
+    }, [selectedGroupForEdit, editingGroupName, editingGroupPath, editingGroupUrl, editingFile, groups, groupsById, clearEditForm, showSuccess, showError])
 
   // 小组排序功能
   const moveGroupUp = useCallback((index: number) => {
@@ -1426,7 +1962,8 @@ export default function Home() {
       const extension = url.split('.').pop()?.toLowerCase()
       
       const mockFile = new File([content], `remote.${extension}`, { type: 'text/plain' })
-      const { names: parsedNames, weights: parsedWeights } = await parseFile(mockFile)
+      // 远程内容每次都重新获取，直接解析，不写入按文件缓存的解析结果
+      const { names: parsedNames, weights: parsedWeights } = await readAndParseFile(mockFile)
       
       setGroups(prev => prev.map(g => 
         g.id === groupId 
@@ -1449,6 +1986,7 @@ export default function Home() {
         // 从Tauri Store加载
         const savedGroups = await getSetting('lottery-groups', [])
         if (savedGroups && Array.isArray(savedGroups)) {
+          loadedGroupsRef.current = savedGroups
           setGroups(savedGroups)
           console.log('✅ 从Tauri Store加载小组数据:', savedGroups.length, '个小组')
         }
@@ -1457,6 +1995,7 @@ export default function Home() {
       const savedGroups = localStorage.getItem('lottery-groups')
       if (savedGroups) {
         const parsedGroups = JSON.parse(savedGroups)
+        loadedGroupsRef.current = parsedGroups
         setGroups(parsedGroups)
           console.log('✅ 从localStorage加载小组数据:', parsedGroups.length, '个小组')
         }
@@ -1550,6 +2089,10 @@ export default function Home() {
       // 🔧 强制从storeway.json读取存储方案，确保使用正确的存储方式
       const { getStorageWayConfig, saveAllSettings } = await import('@/lib/officialStore');
       const currentStorageMethod = await getStorageWayConfig();
+
+      // 设置对象被重新创建但内容未变（如重复选择同一选项）时不再写入
+      const snapshot = JSON.stringify([settings, drawMode, allowRepeat, currentStorageMethod])
+      if (snapshot === lastSavedSettingsRef.current) return
       
       if (currentStorageMethod === 'tauriStore') {
         // 使用Tauri Store保存
@@ -1567,6 +2110,7 @@ export default function Home() {
         localStorage.setItem('lottery-allow-repeat', JSON.stringify(allowRepeat))
         console.log('✅ 设置数据已保存到localStorage')
       }
+      lastSavedSettingsRef.current = snapshot
     } catch (error) {
       console.error('保存设置数据失败:', error)
     }
@@ -1651,7 +2195,7 @@ export default function Home() {
   const saveHistoryTaskToLocalStorage = async (task: any) => {
     try {
       console.log('💾 开始保存历史任务到localStorage分年月结构...');
-      console.log('📋 任务数据:', task);
+      debugLog('📋 任务数据:', task);
       
       const { year, month } = parseYearMonth(task.timestamp);
       const monthStr = month.toString().padStart(2, '0');
@@ -1676,31 +2220,14 @@ export default function Home() {
           console.log(`📝 添加localStorage历史记录: ${storageKey}`);
         }
         
-        // 强制保存回localStorage
-        const dataToSave = JSON.stringify(existingTasks);
-        localStorage.setItem(storageKey, dataToSave);
-        
-        // 验证保存是否成功
-        const savedData = localStorage.getItem(storageKey);
-        if (savedData) {
-          console.log(`✅ 已保存到${storageKey}，当月任务数: ${existingTasks.length}`);
-        } else {
-          throw new Error('localStorage保存失败：数据未找到');
-        }
+        // 强制保存回localStorage（写入失败时setItem会直接抛出异常，无需再读回整个字符串校验）
+        localStorage.setItem(storageKey, JSON.stringify(existingTasks));
+        console.log(`✅ 已保存到${storageKey}，当月任务数: ${existingTasks.length}`);
       } catch (saveError) {
         console.error('❌ localStorage年月存储失败:', saveError);
         throw saveError;
       }
       
-      // 强制更新全局索引
-      try {
-        await updateLocalStorageHistoryIndex();
-        console.log('✅ localStorage全局索引已更新');
-      } catch (indexError) {
-        console.error('❌ localStorage索引更新失败:', indexError);
-        throw indexError;
-      }
-      
       console.log('🎉 localStorage历史任务保存完成!');
     } catch (error) {
       console.error('❌ 保存localStorage历史任务失败:', error);
@@ -1713,64 +2240,40 @@ export default function Home() {
     try {
       console.log('💾 开始批量保存历史任务到localStorage分年月结构...');
       
+      // 按年月存储键分组，每个键只读写一次
+      const tasksByKey = new Map<string, any[]>();
       for (const task of tasks) {
-        await saveHistoryTaskToLocalStorage(task);
+        const { year, month } = parseYearMonth(task.timestamp);
+        const storageKey = `lottery-history-${year}-${month.toString().padStart(2, '0')}`;
+        const keyTasks = tasksByKey.get(storageKey);
+        if (keyTasks) {
+          keyTasks.push(task);
+        } else {
+          tasksByKey.set(storageKey, [task]);
+        }
       }
       
-      console.log('✅ 批量保存localStorage历史任务完成:', tasks.length, '个任务');
-    } catch (error) {
-      console.error('❌ 批量保存localStorage历史任务失败:', error);
-    }
-  };
-
-  // 更新localStorage历史记录索引
-  const updateLocalStorageHistoryIndex = async () => {
-    try {
-      console.log('🔄 开始更新localStorage历史记录索引...');
-      const allTasks: any[] = [];
-      const foundKeys: string[] = [];
-      
-      // 遍历所有localStorage键，查找历史记录
-      for (let i = 0; i < localStorage.length; i++) {
-        const key = localStorage.key(i);
-        if (key && key.startsWith('lottery-history-') && key !== 'lottery-history-tasks') {
-          foundKeys.push(key);
-          try {
-            const tasksStr = localStorage.getItem(key);
-            if (tasksStr) {
-              const tasks = JSON.parse(tasksStr);
-              if (Array.isArray(tasks)) {
-                allTasks.push(...tasks);
-                console.log(`📖 从${key}加载了${tasks.length}个任务`);
-              }
-            }
-          } catch (parseError) {
-            console.error(`❌ 解析${key}失败:`, parseError);
+      tasksByKey.forEach((keyTasks, storageKey) => {
+        const existingTasksStr = localStorage.getItem(storageKey);
+        const existingTasks = existingTasksStr ? JSON.parse(existingTasksStr) : [];
+        
+        for (const task of keyTasks) {
+          // 检查是否已存在，如果存在则更新，否则添加到开头
+          const existingIndex = existingTasks.findIndex((t: any) => t.id === task.id);
+          if (existingIndex >= 0) {
+            existingTasks[existingIndex] = task;
+          } else {
+            existingTasks.unshift(task);
           }
         }
-      }
-      
-      console.log(`📋 找到${foundKeys.length}个年月存储键:`, foundKeys);
-      console.log(`📊 总共收集到${allTasks.length}个任务`);
-      
-      // 按时间戳排序，最新的在前
-      allTasks.sort((a, b) => new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime());
-      
-      // 强制更新主索引
-      const indexData = JSON.stringify(allTasks);
-      localStorage.setItem('lottery-history-tasks', indexData);
+        
+        localStorage.setItem(storageKey, JSON.stringify(existingTasks));
+        debugLog(`✅ 已保存到${storageKey}，当月任务数: ${existingTasks.length}`);
+      });
       
-      // 验证索引保存是否成功
-      const savedIndex = localStorage.getItem('lottery-history-tasks');
-      if (savedIndex) {
-        const parsedIndex = JSON.parse(savedIndex);
-        console.log('✅ localStorage历史记录索引已更新:', parsedIndex.length, '个任务');
-      } else {
-        throw new Error('索引保存失败：数据未找到');
-      }
+      console.log('✅ 批量保存localStorage历史任务完成:', tasks.length, '个任务');
     } catch (error) {
-      console.error('❌ 更新localStorage历史记录索引失败:', error);
-      throw error;
+      console.error('❌ 批量保存localStorage历史任务失败:', error);
     }
   };
 
@@ -1791,7 +2294,7 @@ export default function Home() {
           const tasks = JSON.parse(localStorage.getItem(key) || '[]');
             if (Array.isArray(tasks)) {
           allTasks.push(...tasks);
-              console.log(`📖 从${key}加载了${tasks.length}个任务`);
+              debugLog(`📖 从${key}加载了${tasks.length}个任务`);
             }
           } catch (parseError) {
             console.error(`❌ 解析${key}失败:`, parseError);
@@ -1799,22 +2302,15 @@ export default function Home() {
         }
       }
       
-      console.log(`📋 扫描到${foundKeys.length}个年月存储键:`, foundKeys);
+      debugLog(`📋 扫描到${foundKeys.length}个年月存储键:`, foundKeys);
       console.log(`📊 总共收集到${allTasks.length}个任务`);
       
       // 按时间戳排序，最新的在前
-      allTasks.sort((a, b) => new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime());
+      sortByTimestampDesc(allTasks);
       
-      // 🔧 强制更新索引，确保下次能从索引快速加载
-      if (allTasks.length > 0) {
-        try {
-          const indexData = JSON.stringify(allTasks);
-          localStorage.setItem('lottery-history-tasks', indexData);
-          console.log('✅ 历史记录索引已强制重建:', allTasks.length, '个任务');
-        } catch (indexError) {
-          console.error('❌ 重建索引失败:', indexError);
-        }
-      }
+      // 旧版本会把全部任务再完整复制一份到lottery-history-tasks，加载时只扫描年月键，从不读取它，
+      // 这里移除遗留的副本，释放localStorage配额
+      localStorage.removeItem('lottery-history-tasks');
       
       console.log('✅ 从localStorage分年月结构加载历史任务:', allTasks.length, '个');
       return allTasks;
@@ -1845,11 +2341,6 @@ export default function Home() {
         }
       }
       
-      if (found) {
-        // 更新索引
-        await updateLocalStorageHistoryIndex();
-      }
-      
       return found;
     } catch (error) {
       console.error('❌ 从localStorage删除历史任务失败:', error);
@@ -1857,44 +2348,57 @@ export default function Home() {
     }
   };
 
+  // 直接设置详情（删除、编辑保存、关闭对话框时），同时作废仍在进行的详情加载，
+  // 避免旧的加载结果在之后覆盖刚删除或刚保存的任务详情
+  const replaceHistoryTaskDetail = useCallback((detail: any) => {
+    historyDetailLoadIdRef.current++
+    setSelectedTaskDetail(detail)
+  }, [])
+
   // 根据storeway.json配置加载历史记录详细数据
   const loadHistoryTaskDetail = useCallback(async (taskId: string) => {
+    const loadId = ++historyDetailLoadIdRef.current
+    const applyDetail = (detail: any) => {
+      if (loadId === historyDetailLoadIdRef.current) setSelectedTaskDetail(detail)
+    }
     try {
+      const { getStorageWayConfig, getHistoryTask, isIndexPlaceholderTask } = await import('@/lib/officialStore')
+      // 历史列表在启动时已加载完整数据，编辑和删除也同步更新这份列表，优先直接使用，
+      // 切换任务时不必每次重新读取索引和任务文件；任务文件读取失败时生成的占位任务只有伪结果，仍从文件加载
+      const memoryTask = historyTasksRef.current.find(t => t.id === taskId)
+      if (memoryTask && !isIndexPlaceholderTask(memoryTask)) {
+        applyDetail(memoryTask)
+        return
+      }
+
       // 🔧 直接从storeway.json读取存储方案
-      const { getStorageWayConfig, getHistoryTask } = await import('@/lib/officialStore')
       const storageMethod = await getStorageWayConfig()
       
       if (storageMethod === 'tauriStore') {
-        // 从纯文件夹结构加载详细数据（无索引文件）
+        // 内存中没有时，从纯文件夹结构加载详细数据
         const taskDetail = await getHistoryTask(taskId)
-        if (taskDetail) {
-          setSelectedTaskDetail(taskDetail)
-          console.log('✅ 历史记录详细数据已从文件夹加载:', taskId)
-        } else {
-          // 如果文件夹中没有找到，使用内存中的数据
-          const indexTask = historyTasks.find(t => t.id === taskId)
-          setSelectedTaskDetail(indexTask)
-          console.log('⚠️ 使用内存数据作为详细数据:', taskId)
-        }
+        applyDetail(taskDetail ?? undefined)
+        console.log(taskDetail ? '✅ 历史记录详细数据已从文件夹加载:' : '⚠️ 未找到历史记录详细数据:', taskId)
       } else {
-        // localStorage模式，直接使用现有数据
-        const task = historyTasks.find(t => t.id === taskId)
-        setSelectedTaskDetail(task)
-        console.log('✅ 从localStorage内存数据加载:', taskId)
+        applyDetail(undefined)
       }
     } catch (error) {
       console.error('加载历史记录详细数据失败:', error)
-      // 回退到内存数据
-      const indexTask = historyTasks.find(t => t.id === taskId)
-      setSelectedTaskDetail(indexTask)
+      applyDetail(undefined)
     }
-  }, [historyTasks])
+  }, [])
+
+  // 选中历史任务并加载其详细数据
+  const selectHistoryTask = useCallback((taskId: string) => {
+    setSelectedHistoryTask(taskId)
+    loadHistoryTaskDetail(taskId)
+  }, [loadHistoryTaskDetail])
 
   // 显示密码对话框
   const showPasswordDialogFunc = useCallback((config: {
     title: string
     message: string
-    onConfirm: (password: string) => void
+    onConfirm: (password: string) => void | Promise<void>
     onCancel?: () => void
   }) => {
     setPasswordDialogConfig(config)
@@ -1902,6 +2406,20 @@ export default function Home() {
     setShowPasswordDialogState(true)
   }, [])
 
+  // 提交密码对话框：PBKDF2派生由Web Crypto异步完成，不阻塞界面；
+  // 验证完成前重复按回车或点击不会再次发起派生
+  const confirmPasswordDialog = useCallback(async () => {
+    if (!passwordDialogConfig || passwordVerifyingRef.current) return
+    passwordVerifyingRef.current = true
+    setPasswordVerifying(true)
+    try {
+      await passwordDialogConfig.onConfirm(passwordInput)
+    } finally {
+      passwordVerifyingRef.current = false
+      setPasswordVerifying(false)
+    }
+  }, [passwordDialogConfig, passwordInput])
+
   // 页面初始加载时读取数据
   useEffect(() => {
     const initializeData = async () => {
@@ -1966,6 +2484,7 @@ export default function Home() {
             
             const tauriGroups = await getSetting('lottery-groups', []);
             if (tauriGroups && Array.isArray(tauriGroups)) {
+              loadedGroupsRef.current = tauriGroups;
               setGroups(tauriGroups);
               console.log('✅ 从Tauri Store加载小组数据:', tauriGroups.length, '个小组');
             }
@@ -2053,6 +2572,7 @@ export default function Home() {
         const savedGroups = localStorage.getItem('lottery-groups');
         if (savedGroups) {
           const parsedGroups = JSON.parse(savedGroups);
+          loadedGroupsRef.current = parsedGroups;
           setGroups(parsedGroups);
           console.log('✅ 从localStorage加载小组数据:', parsedGroups.length, '个小组');
         }
@@ -2069,19 +2589,6 @@ export default function Home() {
         }
         console.log(`✅ localStorage验证完成，找到${foundHistoryKeys}个历史存储键:`, historyKeys);
         
-        // 🔧 检查索引文件状态
-        const indexData = localStorage.getItem('lottery-history-tasks');
-        if (indexData) {
-          try {
-            const indexTasks = JSON.parse(indexData);
-            console.log(`📋 历史记录索引存在，包含${indexTasks.length}条记录`);
-          } catch (error) {
-            console.error('❌ 历史记录索引解析失败:', error);
-          }
-        } else {
-          console.log('⚠️ 历史记录索引不存在，需要重建');
-        }
-        
         // 🔧 强制加载localStorage历史记录
         console.log('🔄 在localStorage模式下强制加载历史记录...');
         try {
@@ -2103,22 +2610,9 @@ export default function Home() {
 
   // 监听主题变化，应用到HTML根元素
   useEffect(() => {
-    if (settings.theme === 'light') {
-      document.documentElement.classList.remove('dark')
-      document.documentElement.classList.add('light')
-    } else {
-      document.documentElement.classList.remove('light')
-      document.documentElement.classList.add('dark')
-    }
+    applyThemeClass(settings.theme)
   }, [settings.theme])
 
-  // 小组数据变化时保存
-  useEffect(() => {
-    if (groups.length > 0) {
-      saveGroupsToStorage(groups)
-    }
-  }, [groups, saveGroupsToStorage])
-
   // 🔧 小组数据加载完成后，自动加载最后选择的小组
   useEffect(() => {
     if (groups.length > 0 && !selectedGroupId) {
@@ -2211,8 +2705,10 @@ export default function Home() {
     }
   }, [settings, drawMode, allowRepeat, groups, historyTasks, showError, showSuccess])
 
-  // 简化的自动保存机制
+  // 小组数据变化时保存（合并短时间内的多次变更，只写入一次）
   useEffect(() => {
+    // 刚从存储加载的数据无需写回
+    if (groups === loadedGroupsRef.current) return
     if (groups.length > 0) {
       const timeoutId = setTimeout(() => {
         saveGroupsToStorage(groups)
@@ -2260,24 +2756,6 @@ export default function Home() {
     }
   }, [names.length, isDrawing, canStop, stopLottery, allowRepeat, drawCount, engineRef, startLottery])
 
-  useEffect(() => {
-    // 监听窗口大小调整事件
-    const unlisten = listen('window-resize', () => {
-      // 触发重新渲染
-      window.requestAnimationFrame(() => {
-        // 强制重新计算布局
-        document.body.style.minHeight = '100vh';
-        setTimeout(() => {
-          document.body.style.minHeight = '';
-        }, 0);
-      });
-    });
-
-    return () => {
-      unlisten.then(fn => fn());
-    };
-  }, []);
-
   return (
     <div className="min-h-screen bg-gray-900 text-white flex items-center justify-center">
       {/* 左侧点击区域 */}
@@ -2305,7 +2783,6 @@ export default function Home() {
         {/* 抽奖结果区域 */}
         <LotteryResultDisplay 
           isDrawing={isDrawing} 
-          rollingName={rollingName} 
           winners={winners} 
           settings={settings} 
           resetLottery={resetLottery} 
@@ -2340,6 +2817,7 @@ export default function Home() {
           setShowHistoryDialog={setShowHistoryDialog}
           setShowSettings={setShowSettings}
           showPasswordDialog={showPasswordDialogFunc}
+          updateSetting={updateSetting}
         />
 
         {/* 隐藏的文件输入 */}
@@ -2793,13 +3271,7 @@ export default function Home() {
                             updateSetting('theme', newTheme)
                             
                             // 更新 HTML 根元素的主题类
-                            if (newTheme === 'light') {
-                              document.documentElement.classList.remove('dark')
-                              document.documentElement.classList.add('light')
-                            } else {
-                              document.documentElement.classList.remove('light')
-                              document.documentElement.classList.add('dark')
-                            }
+                            applyThemeClass(newTheme)
                             
                             // 立即保存设置到存储
                             try {
@@ -3150,7 +3622,7 @@ export default function Home() {
                           {/* 设置按钮 */}
                           <div className="pt-2">
                                                       <Button
-                            onClick={() => {
+                            onClick={async () => {
                               // 获取输入框的值
                               const currentPasswordInput = document.getElementById('currentPasswordInput') as HTMLInputElement
                               const newPasswordInput = document.getElementById('newPasswordInput') as HTMLInputElement
@@ -3171,18 +3643,20 @@ export default function Home() {
                                 return
                               }
                               
+                              const { hashPassword, verifyPasswordHash } = await import('@/lib/crypto')
+                              
                               // 如果已经设置了密码，需要验证当前密码
                               if (settings.password) {
                                 // 验证当前密码
-                                if (!verifyPassword(currentPassword, settings.password)) {
+                                if (!(await verifyPasswordHash(currentPassword, settings.password))) {
                                   alert('当前密码不正确')
                                   return
                                 }
                               }
                               
-                              // 加密并保存新密码
-                              const encryptedPassword = encryptPassword(newPassword)
-                              updateSetting('password', encryptedPassword)
+                              // 生成加盐哈希并保存新密码
+                              const passwordHash = await hashPassword(newPassword)
+                              updateSetting('password', passwordHash)
                               
                               // 清空输入框
                               if (currentPasswordInput) currentPasswordInput.value = ''
@@ -3440,210 +3914,7 @@ export default function Home() {
                 </TabsContent>
 
                 <TabsContent value="about">
-                  <div className="space-y-8">
-                    <div className="border-b border-gray-700 pb-4">
-                      <h3 className="text-xl font-semibold text-white mb-2">关于 StarRandom</h3>
-                      <p className="text-gray-400 text-sm">现代化的抽奖系统 - 简单、快速、公平</p>
-                    </div>
-                    
-                    {/* 应用信息 */}
-                    <div className="bg-gray-800/50 rounded-lg p-6 space-y-6">
-                      <div className="flex items-center gap-4">
-                        <div className="w-16 h-16 rounded-xl overflow-hidden">
-                          <img src="/icon.png" alt="StarRandom" className="w-full h-full object-cover" />
-                        </div>
-                        <div>
-                          <h4 className="text-2xl font-bold text-white">StarRandom</h4>
-                          <p className="text-gray-400">现代化抽奖系统</p>
-                        </div>
-                      </div>
-                      
-                      <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
-                        <div className="space-y-3">
-                          <div className="flex justify-between items-center">
-                            <span className="text-gray-300">版本号：</span>
-                            <span className="text-blue-400 font-mono">v1.0.7</span>
-                          </div>
-                          <div className="flex justify-between items-center">
-                            <span className="text-gray-300">构建日期：</span>
-                            <span className="text-gray-400 font-mono">2025-06-29</span>
-                          </div>
-                          <div className="flex justify-between items-center">
-                            <span className="text-gray-300">运行环境：</span>
-                            <span className="text-gray-400">
-                              {typeof window !== 'undefined' && (window as any).__TAURI__ ? 'Tauri App' : 'Web Browser'}
-                            </span>
-                          </div>
-                        </div>
-                        
-                        <div className="space-y-3">
-                          <div className="flex justify-between items-center">
-                            <span className="text-gray-300">技术栈：</span>
-                            <span className="text-gray-400">React + TypeScript</span>
-                          </div>
-                          <div className="flex justify-between items-center">
-                            <span className="text-gray-300">UI 框架：</span>
-                            <span className="text-gray-400">Tailwind CSS</span>
-                          </div>
-                          <div className="flex justify-between items-center">
-                            <span className="text-gray-300">桌面框架：</span>
-                            <span className="text-gray-400">Tauri</span>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                    
-                    {/* 功能特性 */}
-                    <div className="bg-gray-800/50 rounded-lg p-6 space-y-4">
-                      <h4 className="text-lg font-medium text-gray-200 flex items-center gap-2">
-                        <span className="text-yellow-400">⭐</span>
-                        核心特性
-                      </h4>
-                      <div className="grid grid-cols-1 md:grid-cols-2 gap-4">
-                        <div className="flex items-start gap-3 p-3 bg-gray-700/30 rounded-lg">
-                          <div className="w-2 h-2 bg-green-400 rounded-full mt-2"></div>
-                          <div>
-                            <h5 className="text-gray-200 font-medium">多种抽奖模式</h5>
-                            <p className="text-sm text-gray-400 mt-1">支持等概率和权重抽奖</p>
-                          </div>
-                        </div>
-                        <div className="flex items-start gap-3 p-3 bg-gray-700/30 rounded-lg">
-                          <div className="w-2 h-2 bg-blue-400 rounded-full mt-2"></div>
-                          <div>
-                            <h5 className="text-gray-200 font-medium">小组管理</h5>
-                            <p className="text-sm text-gray-400 mt-1">创建和管理多个抽奖小组</p>
-                          </div>
-                        </div>
-                        <div className="flex items-start gap-3 p-3 bg-gray-700/30 rounded-lg">
-                          <div className="w-2 h-2 bg-purple-400 rounded-full mt-2"></div>
-                          <div>
-                            <h5 className="text-gray-200 font-medium">历史记录</h5>
-                            <p className="text-sm text-gray-400 mt-1">完整的抽奖历史和结果管理</p>
-                          </div>
-                        </div>
-                        <div className="flex items-start gap-3 p-3 bg-gray-700/30 rounded-lg">
-                          <div className="w-2 h-2 bg-orange-400 rounded-full mt-2"></div>
-                          <div>
-                            <h5 className="text-gray-200 font-medium">数据安全</h5>
-                            <p className="text-sm text-gray-400 mt-1">密码保护和数据备份</p>
-                          </div>
-                        </div>
-                        <div className="flex items-start gap-3 p-3 bg-gray-700/30 rounded-lg">
-                          <div className="w-2 h-2 bg-red-400 rounded-full mt-2"></div>
-                          <div>
-                            <h5 className="text-gray-200 font-medium">多格式支持</h5>
-                            <p className="text-sm text-gray-400 mt-1">CSV、TXT、JSON 文件导入</p>
-                          </div>
-                        </div>
-                        <div className="flex items-start gap-3 p-3 bg-gray-700/30 rounded-lg">
-                          <div className="w-2 h-2 bg-teal-400 rounded-full mt-2"></div>
-                          <div>
-                            <h5 className="text-gray-200 font-medium">跨平台</h5>
-                            <p className="text-sm text-gray-400 mt-1">支持 Windows、macOS、Linux</p>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                    
-                    {/* 开发信息 */}
-                    <div className="bg-gray-800/50 rounded-lg p-6 space-y-4">
-                      <h4 className="text-lg font-medium text-gray-200 flex items-center gap-2">
-                        <span className="text-blue-400">💻</span>
-                        开发信息
-                      </h4>
-                      <div className="space-y-3">
-                        <div className="flex items-center justify-between">
-                          <span className="text-gray-300">开发者：</span>
-                          <span className="text-gray-400">StarRandom Team</span>
-                        </div>
-                        <div className="flex items-center justify-between">
-                          <span className="text-gray-300">开源协议：</span>
-                          <span className="text-gray-400">GPL-V3.0</span>
-                        </div>
-                        <div className="flex items-center justify-between">
-                          <span className="text-gray-300">项目地址：</span>
-                          <a href="https://github.com/vistaminc/StarRandom" target="_blank" rel="noopener noreferrer" className="text-blue-400 hover:text-blue-300 transition-colors text-sm">
-                            GitHub Repository
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-                    
-                    {/* 系统信息 */}
-                    <div className="bg-gray-800/50 rounded-lg p-6 space-y-4">
-                      <h4 className="text-lg font-medium text-gray-200 flex items-center gap-2">
-                        <span className="text-green-400">🔧</span>
-                        系统信息
-                      </h4>
-                      <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
-                        <div className="space-y-3">
-                          <div className="flex justify-between items-center">
-                            <span className="text-gray-300">浏览器：</span>
-                            <span className="text-gray-400 font-mono text-sm">
-                              {typeof navigator !== 'undefined' ? navigator.userAgent.match(/Chrome|Firefox|Safari|Edge/)?.[0] || 'Unknown' : 'N/A'}
-                            </span>
-                          </div>
-                          <div className="flex justify-between items-center">
-                            <span className="text-gray-300">分辨率：</span>
-                            <span className="text-gray-400 font-mono text-sm">
-                              {typeof window !== 'undefined' ? `${window.screen.width}×${window.screen.height}` : 'N/A'}
-                            </span>
-                          </div>
-                        </div>
-                        <div className="space-y-3">
-                          <div className="flex justify-between items-center">
-                            <span className="text-gray-300">当前主题：</span>
-                            <span className="text-gray-400 capitalize">
-                              {settings.theme === 'dark' ? '暗色主题' : '亮色主题'}
-                            </span>
-                          </div>
-                          <div className="flex justify-between items-center">
-                            <span className="text-gray-300">存储方式：</span>
-                            <span className="text-gray-400">
-                              {settings.storageMethod === 'tauriStore' ? 'Tauri Store' : 'Local Storage'}
-                            </span>
-                          </div>
-                        </div>
-                      </div>
-                    </div>
-                    
-                    {/* 智教合作项目 */}
-                    <div className="bg-gray-800/50 rounded-lg p-6 space-y-4">
-                      <h4 className="text-lg font-medium text-gray-200 flex items-center gap-2">
-                        <span className="text-cyan-400">🤝</span>
-                        智教合作项目
-                      </h4>
-                      <div className="space-y-3">
-                        <div className="flex items-center justify-between p-3 bg-gray-700/30 rounded-lg">
-                          <div>
-                            <h5 className="text-gray-200 font-medium">Seewo-HugoAura</h5>
-                            <p className="text-sm text-gray-400 mt-1">下一代希沃管家注入式修改/破解方案</p>
-                          </div>
-                          <a 
-                            href="https://github.com/HugoAura/Seewo-HugoAura" 
-                            target="_blank" 
-                            rel="noopener noreferrer" 
-                            className="text-cyan-400 hover:text-cyan-300 transition-colors text-sm px-3 py-1 border border-cyan-400 rounded-lg hover:bg-cyan-400/10"
-                          >
-                            访问项目
-                          </a>
-                        </div>
-                      </div>
-                    </div>
-
-                    {/* 感谢信息 */}
-                    <div className="bg-gradient-to-r from-purple-900/20 to-blue-900/20 border border-purple-600/30 rounded-lg p-6 text-center">
-                      <h4 className="text-lg font-medium text-gray-200 mb-3">
-                        <span className="text-purple-400">💝</span> 感谢使用 StarRandom
-                      </h4>
-                      <p className="text-gray-300 mb-4">
-                        如果这个工具对您有帮助，欢迎给我们反馈和建议
-                      </p>
-                      <div className="flex justify-center gap-4 text-sm">
-                        <span className="text-gray-400">版权所有 © 2025 StarRandom Team & 河南星熠寻光科技有限公司 & vistamin </span>
-                      </div>
-                    </div>
-                  </div>
+                  <AboutPanel theme={settings.theme} storageMethod={settings.storageMethod} />
                 </TabsContent>
               </Tabs>
             </Card>
@@ -3671,7 +3942,7 @@ export default function Home() {
                   onClick={() => {
                     setShowHistoryDialog(false)
                     setSelectedHistoryTask('')
-                    setSelectedTaskDetail(null)
+                    replaceHistoryTaskDetail(null)
                   }}
                   variant="ghost"
                   size="icon"
@@ -3732,31 +4003,14 @@ export default function Home() {
                         </div>
                       )
                     ) : (
-                      filteredHistoryTasks.map((task, index) => {
-                        const isSelected = selectedHistoryTask === task.id
-                        return (
-                          <div
-                            key={task.id}
-                            onClick={() => {
-                              setSelectedHistoryTask(task.id)
-                              loadHistoryTaskDetail(task.id)
-                            }}
-                            className={`p-3 rounded-lg border cursor-pointer transition-colors ${
-                              isSelected
-                                ? 'border-blue-500 bg-blue-500/10'
-                                : 'border-gray-600 bg-gray-700/50 hover:bg-gray-700'
-                            }`}
-                          >
-                            <div className="font-medium text-white text-sm">{task.name}</div>
-                            <div className="text-xs text-gray-400 mt-1">
-                              {new Date(task.timestamp).toLocaleString('zh-CN')}
-                            </div>
-                            <div className="text-xs text-gray-500 mt-1">
-                              {task.group_name} • {task.total_count} 人
-                            </div>
-                          </div>
-                        )
-                      })
+                      filteredHistoryTasks.map(task => (
+                        <HistoryTaskItem
+                          key={task.id}
+                          task={task}
+                          isSelected={selectedHistoryTask === task.id}
+                          onSelect={selectHistoryTask}
+                        />
+                      ))
                     )}
                   </div>
                 </div>
@@ -3774,7 +4028,7 @@ export default function Home() {
                             <div>
                               <h3 className="text-lg font-medium text-white">{selectedTask.name}</h3>
                               <div className="text-sm text-gray-400 space-y-1 mt-2">
-                                <div>创建时间: {new Date(selectedTask.timestamp).toLocaleString('zh-CN')}</div>
+                                <div>创建时间: {formatTaskTime(selectedTask.timestamp)}</div>
                                 <div>小组名称: {selectedTask.group_name}</div>
                                 <div>总人数: {selectedTask.total_count}</div>
                                 <div>导出文件: {selectedTask.file_path}</div>
@@ -3788,11 +4042,16 @@ export default function Home() {
                                     showPasswordDialogFunc({
                                       title: '编辑保护验证',
                                       message: '该任务已设置编辑保护，请输入编辑密码：',
-                                      onConfirm: (password) => {
-                                        if (!verifyPassword(password, selectedTask.edit_password)) {
+                                      onConfirm: async (password) => {
+                                        const { verifyPasswordHash, isPasswordHashed, hashPassword } = await import('@/lib/crypto')
+                                        if (!(await verifyPasswordHash(password, selectedTask.edit_password))) {
                                           showError('编辑密码不正确')
                                           return
                                         }
+                                        // 旧的可逆加密或明文编辑密码验证通过后升级为PBKDF2哈希，随编辑结果一起保存
+                                        upgradedEditPasswordRef.current = isPasswordHashed(selectedTask.edit_password)
+                                          ? null
+                                          : { taskId: selectedTask.id, hash: await hashPassword(password) }
                                         setEditingHistoryTask(selectedTask.id)
                                         setEditingResults(selectedTask.results.join('\n'))
                                       },
@@ -3815,8 +4074,12 @@ export default function Home() {
                               <Button
                                 onClick={() => {
                                   // 重新导出历史任务
-                                  const content = selectedTask.results.map((result: string, i: number) => `${i + 1}. ${result}`).join('\n')
-                                  const blob = new Blob([content], { type: 'text/plain' })
+                                  // 每行自带换行符（最后一行除外）直接交给Blob，不再先拼接成一个完整字符串
+                                  const lastIndex = selectedTask.results.length - 1
+                                  const lines = selectedTask.results.map((result: string, i: number) =>
+                                    i < lastIndex ? `${i + 1}. ${result}\n` : `${i + 1}. ${result}`
+                                  )
+                                  const blob = new Blob(lines, { type: 'text/plain' })
                                   const url = URL.createObjectURL(blob)
                                   const link = document.createElement('a')
                                   link.href = url
@@ -3852,7 +4115,7 @@ export default function Home() {
                                       setHistoryTasks(updatedTasks)
                                       
                                       setSelectedHistoryTask('')
-                                      setSelectedTaskDetail(null)
+                                      replaceHistoryTaskDetail(null)
                                       showSuccess('任务删除成功')
                                     }
                                   })
@@ -3892,6 +4155,11 @@ export default function Home() {
                                       }
                                       
                                       const updatedTask = { ...selectedTask, results: newResults, total_count: newResults.length }
+                                      const upgradedPassword = upgradedEditPasswordRef.current
+                                      if (upgradedPassword && upgradedPassword.taskId === selectedTask.id) {
+                                        updatedTask.edit_password = upgradedPassword.hash
+                                        upgradedEditPasswordRef.current = null
+                                      }
                                       
                                       if (settings.storageMethod === 'tauriStore') {
                                         // 使用Tauri Store分年月存储方案更新单个记录
@@ -3908,7 +4176,7 @@ export default function Home() {
                                           : t
                                       )
                                       setHistoryTasks(updatedTasks)
-                                      setSelectedTaskDetail(updatedTask) // 更新详细视图
+                                      replaceHistoryTaskDetail(updatedTask) // 更新详细视图
                                       
                                       setEditingHistoryTask('')
                                       setEditingResults('')
@@ -3933,18 +4201,7 @@ export default function Home() {
                             ) : (
                               /* 查看模式 */
                               <div className="h-full overflow-y-auto">
-                                <div className="grid grid-cols-1 gap-2">
-                                  {selectedTask.results.map((result: string, i: number) => (
-                                    <div
-                                      key={i}
-                                      className="flex items-center justify-between p-2 bg-gray-700/30 rounded text-sm"
-                                    >
-                                      <span className="text-gray-300">
-                                        {i + 1}. {result}
-                                      </span>
-                                    </div>
-                                  ))}
-                                </div>
+                                <HistoryResultList results={selectedTask.results} />
                               </div>
                             )}
                           </div>
@@ -4026,7 +4283,7 @@ export default function Home() {
                           console.log('✅ 已清空localStorage分年月历史数据:', keysToRemove.length, '个存储键')
                         }
                         setSelectedHistoryTask('')
-                        setSelectedTaskDetail(null)
+                        replaceHistoryTaskDetail(null)
                         showSuccess('历史任务已清空')
                       }
                     })
@@ -4044,7 +4301,7 @@ export default function Home() {
                   onClick={() => {
                     setShowHistoryDialog(false)
                     setSelectedHistoryTask('')
-                    setSelectedTaskDetail(null)
+                    replaceHistoryTaskDetail(null)
                   }}
                   variant="outline"
                 >
@@ -4089,7 +4346,7 @@ export default function Home() {
                     className="w-full px-4 py-3 bg-gray-800 border border-gray-600 rounded-lg text-white focus:ring-2 focus:ring-orange-500 focus:border-orange-500 transition-colors"
                     onKeyDown={(e) => {
                       if (e.key === 'Enter') {
-                        passwordDialogConfig.onConfirm(passwordInput)
+                        confirmPasswordDialog()
                       }
                     }}
                     autoFocus
@@ -4108,9 +4365,10 @@ export default function Home() {
                     取消
                   </Button>
                   <Button
-                    onClick={() => passwordDialogConfig.onConfirm(passwordInput)}
+                    onClick={confirmPasswordDialog}
                     className="flex-1 bg-orange-600 hover:bg-orange-700"
                     disabled={!passwordInput.trim()}
+                    loading={passwordVerifying}
                   >
                     <Lock className="w-4 h-4 mr-2" />
                     验证
@@ -4205,19 +4463,15 @@ export default function Home() {
                 <div className="bg-gray-800/50 rounded-lg p-4 space-y-3">
                   <h4 className="text-sm font-medium text-gray-200">抽奖结果预览</h4>
                   <div className="max-h-32 overflow-y-auto space-y-1">
-                    {drawnResults.slice(0, 10).map((result, index) => (
-                      <div key={index} className="text-sm text-gray-300 py-1 px-2 bg-gray-700/30 rounded">
-                        {index + 1}. {result}
-                      </div>
-                    ))}
-                    {drawnResults.length > 10 && (
+                    {exportPreviewRows}
+                    {drawnResults.length > EXPORT_PREVIEW_LIMIT && (
                       <div className="text-xs text-gray-500 text-center py-1">
-                        ... 还有 {drawnResults.length - 10} 个结果
+                        {`... 还有 ${drawnResults.length - EXPORT_PREVIEW_LIMIT} 个结果`}
                       </div>
                     )}
                   </div>
                   <div className="text-xs text-gray-500 text-right">
-                    共 {drawnResults.length} 个抽奖结果
+                    {`共 ${drawnResults.length} 个抽奖结果`}
                   </div>
                 </div>
 
@@ -114,17 +114,20 @@ export const ConfirmDialog: React.FC<ConfirmDialogProps> = ({
   )
 }
 
-// 简化的使用Hook
-export const useConfirmDialog = () => {
-  const [dialogState, setDialogState] = React.useState<{
-    isOpen: boolean
-    title: string
-    message: string
-    type: 'danger' | 'warning' | 'info' | 'success'
-    confirmText: string
-    cancelText: string
-    onConfirm: () => void
-  }>({
+type ConfirmDialogState = {
+  isOpen: boolean
+  title: string
+  message: string
+  type: 'danger' | 'warning' | 'info' | 'success'
+  confirmText: string
+  cancelText: string
+  onConfirm: () => void
+}
+
+// 对话框状态放在外部store中，由对话框组件自行订阅：返回给页面的组件类型保持不变，
+// 打开或关闭对话框时只有对话框本身重新渲染
+const createConfirmDialogStore = () => {
+  let state: ConfirmDialogState = {
     isOpen: false,
     title: '',
     message: '',
@@ -132,7 +135,46 @@ export const useConfirmDialog = () => {
     confirmText: '确认',
     cancelText: '取消',
     onConfirm: () => {}
-  })
+  }
+  const listeners = new Set<() => void>()
+  return {
+    get: () => state,
+    set: (next: ConfirmDialogState) => {
+      state = next
+      listeners.forEach(listener => listener())
+    },
+    subscribe: (listener: () => void) => {
+      listeners.add(listener)
+      return () => {
+        listeners.delete(listener)
+      }
+    }
+  }
+}
+
+// 订阅store并渲染对话框
+const StoreConfirmDialog = ({ store, onClose }: {
+  store: ReturnType<typeof createConfirmDialogStore>
+  onClose: () => void
+}) => {
+  const state = React.useSyncExternalStore(store.subscribe, store.get, store.get)
+  return (
+    <ConfirmDialog
+      isOpen={state.isOpen}
+      onClose={onClose}
+      onConfirm={state.onConfirm}
+      title={state.title}
+      message={state.message}
+      type={state.type}
+      confirmText={state.confirmText}
+      cancelText={state.cancelText}
+    />
+  )
+}
+
+// 简化的使用Hook
+export const useConfirmDialog = () => {
+  const [store] = React.useState(createConfirmDialogStore)
 
   const showConfirm = React.useCallback((options: {
     title: string
@@ -142,7 +184,7 @@ export const useConfirmDialog = () => {
     cancelText?: string
     onConfirm: () => void
   }) => {
-    setDialogState({
+    store.set({
       isOpen: true,
       title: options.title,
       message: options.message,
@@ -151,28 +193,20 @@ export const useConfirmDialog = () => {
       cancelText: options.cancelText || '取消',
       onConfirm: options.onConfirm
     })
-  }, [])
+  }, [store])
 
   const hideConfirm = React.useCallback(() => {
-    setDialogState(prev => ({ ...prev, isOpen: false }))
-  }, [])
+    store.set({ ...store.get(), isOpen: false })
+  }, [store])
 
-  const ConfirmDialogComponent = React.useCallback(() => (
-    <ConfirmDialog
-      isOpen={dialogState.isOpen}
-      onClose={hideConfirm}
-      onConfirm={dialogState.onConfirm}
-      title={dialogState.title}
-      message={dialogState.message}
-      type={dialogState.type}
-      confirmText={dialogState.confirmText}
-      cancelText={dialogState.cancelText}
-    />
-  ), [dialogState, hideConfirm])
+  const ConfirmDialogComponent = React.useCallback(
+    () => <StoreConfirmDialog store={store} onClose={hideConfirm} />,
+    [store, hideConfirm]
+  )
 
   return {
     showConfirm,
     hideConfirm,
     ConfirmDialog: ConfirmDialogComponent
   }
-} 
\ No newline at end of file
+}
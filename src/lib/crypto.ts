@@ -1,32 +1,10 @@
 /**
- * 简单的密码加密工具
- * 提供基本的加密和解密功能
+ * 密码工具
+ * 新密码统一保存为PBKDF2哈希，旧的可逆加密格式仅保留解密以兼容验证
  */
 
-// 简单的字符串加密函数（基于Base64和简单的字符转换）
-export function encryptPassword(password: string): string {
-  if (!password) return ''
-  
-  try {
-    // 第一步：将字符串转换为Base64
-    const base64 = btoa(unescape(encodeURIComponent(password)))
-    
-    // 第二步：简单的字符替换加密
-    let encrypted = ''
-    for (let i = 0; i < base64.length; i++) {
-      const char = base64.charCodeAt(i)
-      // 简单的字符码偏移
-      const encryptedChar = String.fromCharCode(char + 3)
-      encrypted += encryptedChar
-    }
-    
-    // 第三步：再次Base64编码
-    return btoa(encrypted)
-  } catch (error) {
-    console.error('密码加密失败:', error)
-    return password // 如果加密失败，返回原密码
-  }
-}
+// 严格的UTF-8解码器，遇到非法字节序列时抛出异常
+const utf8Decoder = new TextDecoder('utf-8', { fatal: true, ignoreBOM: true })
 
 // 简单的字符串解密函数
 export function decryptPassword(encryptedPassword: string): string {
@@ -36,17 +14,20 @@ export function decryptPassword(encryptedPassword: string): string {
     // 第一步：Base64解码
     const step1 = atob(encryptedPassword)
     
-    // 第二步：字符替换解密
-    let decrypted = ''
+    // 第二步：字符替换解密（先在定长数组中还原字符码偏移，再一次性生成字符串，避免逐字符拼接）
+    const codes = new Uint16Array(step1.length)
     for (let i = 0; i < step1.length; i++) {
-      const char = step1.charCodeAt(i)
-      // 还原字符码偏移
-      const decryptedChar = String.fromCharCode(char - 3)
-      decrypted += decryptedChar
+      codes[i] = step1.charCodeAt(i) - 3
     }
+    const decrypted = String.fromCharCode.apply(null, codes as unknown as number[])
     
-    // 第三步：Base64解码
-    return decodeURIComponent(escape(atob(decrypted)))
+    // 第三步：Base64解码得到UTF-8字节，一次性解码为字符串（格式错误时抛出，与原先decodeURIComponent一致）
+    const binary = atob(decrypted)
+    const bytes = new Uint8Array(binary.length)
+    for (let i = 0; i < binary.length; i++) {
+      bytes[i] = binary.charCodeAt(i)
+    }
+    return utf8Decoder.decode(bytes)
   } catch (error) {
     console.error('密码解密失败:', error)
     return encryptedPassword // 如果解密失败，返回原密码
@@ -57,26 +38,107 @@ export function decryptPassword(encryptedPassword: string): string {
 export function verifyPassword(inputPassword: string, storedEncryptedPassword: string): boolean {
   if (!inputPassword || !storedEncryptedPassword) return false
   
-  try {
-    const decrypted = decryptPassword(storedEncryptedPassword)
-    return inputPassword === decrypted
-  } catch (error) {
-    console.error('密码验证失败:', error)
-    // 如果解密失败，可能是明文密码，直接比较
-    return inputPassword === storedEncryptedPassword
+  // decryptPassword自行捕获解密错误并原样返回输入，因此明文密码在这里会直接与输入比较
+  return inputPassword === decryptPassword(storedEncryptedPassword)
+}
+
+// PBKDF2哈希参数
+const PBKDF2_PREFIX = 'pbkdf2'
+const PBKDF2_ITERATIONS = 100000
+const PBKDF2_SALT_BYTES = 16
+const PBKDF2_KEY_BITS = 256
+// 验证时接受的迭代次数范围，防止被篡改或损坏的哈希要求0次、NaN或极大的迭代次数而报错或卡住界面
+const PBKDF2_MIN_ITERATIONS = 1000
+const PBKDF2_MAX_ITERATIONS = 10000000
+
+// 字节数组转十六进制字符串
+function bytesToHex(bytes: Uint8Array): string {
+  let hex = ''
+  for (let i = 0; i < bytes.length; i++) {
+    hex += bytes[i].toString(16).padStart(2, '0')
   }
+  return hex
 }
 
-// 检查密码是否已加密
-export function isPasswordEncrypted(password: string): boolean {
-  if (!password) return false
-  
+// 十六进制字符串转字节数组
+function hexToBytes(hex: string) {
+  const bytes = new Uint8Array(hex.length / 2)
+  for (let i = 0; i < bytes.length; i++) {
+    bytes[i] = parseInt(hex.slice(i * 2, i * 2 + 2), 16)
+  }
+  return bytes
+}
+
+// 常量时间比较，避免通过比较耗时泄露信息
+function constantTimeEqual(a: Uint8Array, b: Uint8Array): boolean {
+  if (a.length !== b.length) return false
+  let diff = 0
+  for (let i = 0; i < a.length; i++) {
+    diff |= a[i] ^ b[i]
+  }
+  return diff === 0
+}
+
+// 复用同一个编码器，避免每次派生密钥都新建
+const textEncoder = new TextEncoder()
+
+// Web Crypto后端在模块加载时解析一次，之后每次派生直接使用；非安全上下文中不可用时为undefined
+const subtle: SubtleCrypto | undefined = globalThis.crypto?.subtle
+
+// 使用Web Crypto的PBKDF2-SHA256派生密钥
+async function deriveKey(password: string, salt: BufferSource, iterations: number): Promise<Uint8Array> {
+  if (!subtle) {
+    throw new Error('当前环境不支持Web Crypto，无法处理密码哈希')
+  }
+  const baseKey = await subtle.importKey(
+    'raw',
+    textEncoder.encode(password),
+    'PBKDF2',
+    false,
+    ['deriveBits']
+  )
+  const bits = await subtle.deriveBits(
+    { name: 'PBKDF2', hash: 'SHA-256', salt, iterations },
+    baseKey,
+    PBKDF2_KEY_BITS
+  )
+  return new Uint8Array(bits)
+}
+
+// 检查是否为PBKDF2哈希格式
+export function isPasswordHashed(stored: string): boolean {
+  return !!stored && stored.startsWith(PBKDF2_PREFIX + '$')
+}
+
+// 生成加盐的PBKDF2密码哈希，格式为 pbkdf2$迭代次数$盐$哈希
+export async function hashPassword(password: string): Promise<string> {
+  if (!password) return ''
+
+  const salt = crypto.getRandomValues(new Uint8Array(PBKDF2_SALT_BYTES))
+  const derived = await deriveKey(password, salt, PBKDF2_ITERATIONS)
+  return [PBKDF2_PREFIX, PBKDF2_ITERATIONS, bytesToHex(salt), bytesToHex(derived)].join('$')
+}
+
+// 验证密码，兼容旧的可逆加密格式和明文
+export async function verifyPasswordHash(inputPassword: string, stored: string): Promise<boolean> {
+  if (!inputPassword || !stored) return false
+
+  if (!isPasswordHashed(stored)) {
+    return verifyPassword(inputPassword, stored)
+  }
+
   try {
-    // 尝试解密，如果能成功解密且结果不同，则说明是加密的
-    const decrypted = decryptPassword(password)
-    return decrypted !== password
+    const [, iterationsText, saltHex, hashHex] = stored.split('$')
+    const iterations = /^\d+$/.test(iterationsText) ? parseInt(iterationsText, 10) : NaN
+    if (!(iterations >= PBKDF2_MIN_ITERATIONS && iterations <= PBKDF2_MAX_ITERATIONS)) {
+      console.error('密码哈希的迭代次数无效:', iterationsText)
+      return false
+    }
+    const derived = await deriveKey(inputPassword, hexToBytes(saltHex), iterations)
+    // 直接比较派生字节与存储的哈希字节，不再把派生结果转成十六进制字符串
+    return hashHex.length === derived.length * 2 && constantTimeEqual(derived, hexToBytes(hashHex))
   } catch (error) {
-    // 解密失败，说明不是加密格式
+    console.error('密码哈希验证失败:', error)
     return false
   }
-} 
\ No newline at end of file
+}
@@ -1,6 +1,8 @@
 // 官方Tauri Store插件存储管理器
 import { Store } from '@tauri-apps/plugin-store';
 import { path } from '@tauri-apps/api';
+import { invoke } from '@tauri-apps/api/core';
+import { debugLog, sortByTimestampDesc } from '@/lib/utils';
 
 // 存储实例
 let store: Store | null = null;
@@ -10,27 +12,49 @@ let historyStoreInitialized = false;
 let actualStorePath = '';
 let actualHistoryStorePath = '';
 
+// 目录路径在运行期间不会变化，只解析一次
+let exeDirectoryPromise: Promise<string> | null = null;
+let coreDataDirectoryPromise: Promise<string> | null = null;
+let historyRootPathPromise: Promise<string> | null = null;
+
 // 获取exe文件所在目录
 async function getExeDirectory(): Promise<string> {
-  try {
+  if (!exeDirectoryPromise) {
     // 在Tauri桌面应用中，当前工作目录通常就是exe文件所在目录
-    const currentDir = await path.resolve('.');
-    console.log('📁 当前工作目录（exe目录）:', currentDir);
-    return currentDir;
+    exeDirectoryPromise = path.resolve('.').then(currentDir => {
+      console.log('📁 当前工作目录（exe目录）:', currentDir);
+      return currentDir;
+    });
+  }
+
+  try {
+    return await exeDirectoryPromise;
   } catch (error) {
+    exeDirectoryPromise = null;
     console.error('❌ 获取exe目录失败:', error);
     throw error;
   }
 }
 
+// 获取coredata目录
+async function getCoreDataDirectory(): Promise<string> {
+  if (!coreDataDirectoryPromise) {
+    coreDataDirectoryPromise = getExeDirectory().then(exeDir => path.join(exeDir, 'coredata'));
+  }
+
+  try {
+    return await coreDataDirectoryPromise;
+  } catch (error) {
+    coreDataDirectoryPromise = null;
+    throw error;
+  }
+}
+
 // 获取可能的存储路径信息
 async function getPathInfo(): Promise<void> {
   try {
     console.log('🔍 检查路径信息...');
     
-    const currentDir = await path.resolve('.');
-    console.log('📁 当前工作目录:', currentDir);
-    
     const resourceDir = await path.resourceDir();
     console.log('📁 资源目录:', resourceDir);
     
@@ -56,12 +80,10 @@ async function initStore(): Promise<Store> {
 
   try {
     console.log('🔧 初始化设置Store到exe文件目录...');
-    await getPathInfo();
     
     // 方案1：使用exe文件目录的绝对路径
     try {
-      const exeDir = await getExeDirectory();
-      const coreDataDir = await path.join(exeDir, 'coredata');
+      const coreDataDir = await getCoreDataDirectory();
       const settingsPath = await path.join(coreDataDir, 'settings.json');
       
       console.log('📁 设置Store目标路径:', settingsPath);
@@ -108,8 +130,7 @@ async function initHistoryStore(): Promise<Store> {
     
     // 使用exe文件目录的绝对路径
     try {
-      const exeDir = await getExeDirectory();
-      const coreDataDir = await path.join(exeDir, 'coredata');
+      const coreDataDir = await getCoreDataDirectory();
       const historyPath = await path.join(coreDataDir, 'history.json');
       
       console.log('📁 历史索引Store目标路径:', historyPath);
@@ -190,10 +211,8 @@ export async function saveAllSettings(settings: Record<string, any>): Promise<vo
   try {
     const storeInstance = await getStore();
     
-    // 逐一保存所有设置
-    for (const [key, value] of Object.entries(settings)) {
-      await storeInstance.set(key, value);
-    }
+    // 所有键同时提交，不再逐个等待；autoSave的防抖会把这些修改合并为一次磁盘写入
+    await Promise.all(Object.entries(settings).map(([key, value]) => storeInstance.set(key, value)));
     
     console.log('✅ 所有设置已保存');
   } catch (error) {
@@ -335,6 +354,36 @@ export function getActualHistoryStorePath(): string {
 
 let storageWayStore: Store | null = null;
 let storageWayInitialized = false;
+// 存储方式的内存快照，只在首次读取和保存时更新，避免每次读写数据前都查询Store
+let cachedStorageMethod: 'localStorage' | 'tauriStore' | null = null;
+
+// storeway.json默认配置（不含时间戳）
+const DEFAULT_STOREWAY_CONFIG = Object.freeze({
+  "storage-method": "tauriStore",
+  "storage-location": "exe-directory",
+  "data-directory": "./coredata",
+  "history-enabled": true,
+  "history-folder": "./coredata/history",
+  "history-index": "./coredata/history.json",
+  "auto-backup": true,
+  "backup-interval": 300000,
+  "max-history-files": 1000,
+  "file-naming-pattern": "{task_name}_{timestamp}_{task_id}.json",
+  "year-month-folders": true,
+  "app-version": "1.0.7",
+  "config-version": "1.0",
+  "description": "StarRandom应用的永久存储配置文件"
+});
+
+// 生成带当前时间戳的storeway.json默认配置
+function createDefaultStorewayConfig(): Record<string, any> {
+  const now = new Date().toISOString();
+  return {
+    ...DEFAULT_STOREWAY_CONFIG,
+    "created-time": now,
+    "updated-time": now
+  };
+}
 
 // 初始化存储方式配置Store
 async function initStorageWayStore(): Promise<Store> {
@@ -347,8 +396,6 @@ async function initStorageWayStore(): Promise<Store> {
     
     // 首先确保coredata目录存在
     try {
-      const { invoke } = await import('@tauri-apps/api/core');
-      
       // 检查coredata目录是否存在
       try {
         await invoke('list_directory', { dirPath: 'coredata' });
@@ -367,27 +414,9 @@ async function initStorageWayStore(): Promise<Store> {
       } catch {
         console.log('📁 storeway.json不存在，正在创建...');
         // 创建默认的storeway.json
-        const defaultConfig = {
-          "storage-method": "tauriStore",
-          "storage-location": "exe-directory", 
-          "data-directory": "./coredata",
-          "history-enabled": true,
-          "history-folder": "./coredata/history",
-          "history-index": "./coredata/history.json",
-          "auto-backup": true,
-          "backup-interval": 300000,
-          "max-history-files": 1000,
-          "file-naming-pattern": "{task_name}_{timestamp}_{task_id}.json",
-          "year-month-folders": true,
-          "created-time": new Date().toISOString(),
-          "updated-time": new Date().toISOString(),
-          "app-version": "1.0.7",
-          "config-version": "1.0",
-          "description": "StarRandom应用的永久存储配置文件"
-        };
         await invoke('save_json_file', { 
           filePath: 'coredata/storeway.json', 
-          data: JSON.stringify(defaultConfig, null, 2) 
+          data: JSON.stringify(createDefaultStorewayConfig(), null, 2) 
         });
         console.log('✅ storeway.json已创建');
       }
@@ -395,8 +424,7 @@ async function initStorageWayStore(): Promise<Store> {
       console.warn('⚠️ 使用Tauri命令创建失败，尝试Store方式:', invokeError);
     }
     
-    const exeDir = await getExeDirectory();
-    const coreDataDir = await path.join(exeDir, 'coredata');
+    const coreDataDir = await getCoreDataDirectory();
     const storageWayPath = await path.join(coreDataDir, 'storeway.json');
     
     console.log('📁 存储方式配置路径:', storageWayPath);
@@ -423,6 +451,7 @@ export async function saveStorageWayConfig(storageMethod: 'localStorage' | 'taur
     await store.set('updated-time', new Date().toISOString());
     await store.set('app-version', '1.0.7');
     await store.save();
+    cachedStorageMethod = storageMethod;
     
     console.log('✅ 存储方式配置已保存到storeway.json');
   } catch (error) {
@@ -433,6 +462,10 @@ export async function saveStorageWayConfig(storageMethod: 'localStorage' | 'taur
 
 // 获取存储方式配置
 export async function getStorageWayConfig(): Promise<'localStorage' | 'tauriStore'> {
+  if (cachedStorageMethod) {
+    return cachedStorageMethod;
+  }
+
   try {
     console.log('📖 读取存储方式配置...');
     
@@ -441,6 +474,7 @@ export async function getStorageWayConfig(): Promise<'localStorage' | 'tauriStor
     
     if (storageMethod) {
       console.log('✅ 从storeway.json读取存储方式:', storageMethod);
+      cachedStorageMethod = storageMethod;
       return storageMethod;
     } else {
       console.log('📝 storeway.json中无配置，使用默认值: tauriStore');
@@ -462,8 +496,6 @@ export async function initializeDirectoryStructure(): Promise<void> {
     
     // 方法1: 使用Tauri命令创建基础目录
     try {
-      const { invoke } = await import('@tauri-apps/api/core');
-      
       // 检查并创建coredata目录
       try {
         await invoke('list_directory', { dirPath: 'coredata' });
@@ -491,25 +523,7 @@ export async function initializeDirectoryStructure(): Promise<void> {
         console.log('✅ storeway.json配置文件已存在');
       } catch {
         console.log('📁 创建storeway.json配置文件');
-        const defaultStorewayConfig = {
-          "storage-method": "tauriStore",
-          "storage-location": "exe-directory", 
-          "data-directory": "./coredata",
-          "history-enabled": true,
-          "history-folder": "./coredata/history",
-          "history-index": "./coredata/history.json",
-          "auto-backup": true,
-          "backup-interval": 300000,
-          "max-history-files": 1000,
-          "file-naming-pattern": "{task_name}_{timestamp}_{task_id}.json",
-          "year-month-folders": true,
-          "created-time": new Date().toISOString(),
-          "updated-time": new Date().toISOString(),
-          "app-version": "1.0.7",
-          "config-version": "1.0",
-          "description": "StarRandom应用的永久存储配置文件"
-        };
-        await invoke('save_json_file', { filePath: 'coredata/storeway.json', data: JSON.stringify(defaultStorewayConfig, null, 2) });
+        await invoke('save_json_file', { filePath: 'coredata/storeway.json', data: JSON.stringify(createDefaultStorewayConfig(), null, 2) });
         console.log('✅ storeway.json配置文件创建成功');
       }
       
@@ -520,7 +534,7 @@ export async function initializeDirectoryStructure(): Promise<void> {
       } catch {
         console.log('📁 创建history.json索引文件');
         const defaultHistoryArray: any[] = []; // 直接使用数组格式，不包装
-        await invoke('save_json_file', { filePath: 'coredata/history.json', data: JSON.stringify(defaultHistoryArray, null, 2) });
+        await invoke('save_json_file', { filePath: 'coredata/history.json', data: JSON.stringify(defaultHistoryArray) });
         console.log('✅ history.json索引文件创建成功（数组格式）');
       }
       
@@ -577,12 +591,14 @@ interface HistoryIndex {
 
 // 获取历史记录根文件夹路径
 async function getHistoryRootPath(): Promise<string> {
+  if (!historyRootPathPromise) {
+    historyRootPathPromise = getCoreDataDirectory().then(coreDataDir => path.join(coreDataDir, 'history'));
+  }
+
   try {
-    const exeDir = await getExeDirectory();
-    const coreDataDir = await path.join(exeDir, 'coredata');
-    const historyDir = await path.join(coreDataDir, 'history');
-    return historyDir;
+    return await historyRootPathPromise;
   } catch (error) {
+    historyRootPathPromise = null;
     console.error('❌ 获取历史文件夹路径失败:', error);
     return './coredata/history';
   }
@@ -612,12 +628,8 @@ async function ensureYearMonthDirectory(year: number, month: number): Promise<st
     
     // 方法1: 使用Tauri的invoke命令创建目录
     try {
-      const { invoke } = await import('@tauri-apps/api/core');
-      
-      // 检查目录是否存在
-      const yearPath = await path.join(await getHistoryRootPath(), year.toString());
+      // 检查目录是否存在（yearMonthPath已是完整的年月路径，不再重复拼接）
       const monthStr = month.toString().padStart(2, '0');
-      const fullMonthPath = await path.join(yearPath, monthStr);
       
       // 创建年份目录
       try {
@@ -645,8 +657,8 @@ async function ensureYearMonthDirectory(year: number, month: number): Promise<st
         });
       }
       
-      console.log('✅ 年月目录已确保存在:', fullMonthPath);
-      return fullMonthPath;
+      console.log('✅ 年月目录已确保存在:', yearMonthPath);
+      return yearMonthPath;
       
     } catch (invokeError) {
       console.warn('⚠️ Tauri invoke方式创建目录失败，尝试Store方式:', invokeError);
@@ -690,45 +702,44 @@ export async function getHistoryIndex(): Promise<HistoryIndex[]> {
     
     // 直接读取history.json文件内容，期望是数组格式
     try {
-      const { invoke } = await import('@tauri-apps/api/core');
-      const historyContent = await invoke('load_json_file', { filePath: 'coredata/history.json' });
+      // 由Rust端按字节读取并解析，省去整段文本的传输和再次JSON.parse
+      const historyData = await invoke<any>('load_json_value', { filePath: 'coredata/history.json' });
+      if (historyData === null) {
+        throw new Error('history.json不存在');
+      }
       
-      if (typeof historyContent === 'string') {
-        const historyData = JSON.parse(historyContent);
+      // 如果是数组格式，直接返回
+      if (Array.isArray(historyData)) {
+        console.log('✅ 历史记录数组已加载:', historyData.length, '条记录');
+        return historyData;
+      }
+      
+      // 如果是旧的包装格式，提取数组部分
+      if (historyData && historyData['history-tasks'] && Array.isArray(historyData['history-tasks'])) {
+        console.log('📝 检测到旧格式，提取历史记录数组...');
+        const extractedArray = historyData['history-tasks'];
         
-        // 如果是数组格式，直接返回
-        if (Array.isArray(historyData)) {
-          console.log('✅ 历史记录数组已加载:', historyData.length, '条记录');
-          return historyData;
-        }
+        // 转换为新格式并保存
+        const convertedArray = extractedArray.map((task: any) => ({
+          id: task.id,
+          name: task.name,
+          timestamp: task.timestamp,
+          fileName: task.fileName || `${task.name}_${task.id}.json`,
+          relativePath: task.relativePath || `unknown/${task.fileName || task.id}.json`,
+          totalCount: task.totalCount || task.total_count || 0,
+          groupName: task.groupName || task.group_name || '未知小组',
+          year: task.year || new Date(task.timestamp).getFullYear(),
+          month: task.month || (new Date(task.timestamp).getMonth() + 1)
+        }));
         
-        // 如果是旧的包装格式，提取数组部分
-        if (historyData && historyData['history-tasks'] && Array.isArray(historyData['history-tasks'])) {
-          console.log('📝 检测到旧格式，提取历史记录数组...');
-          const extractedArray = historyData['history-tasks'];
-          
-          // 转换为新格式并保存
-          const convertedArray = extractedArray.map((task: any) => ({
-            id: task.id,
-            name: task.name,
-            timestamp: task.timestamp,
-            fileName: task.fileName || `${task.name}_${task.id}.json`,
-            relativePath: task.relativePath || `unknown/${task.fileName || task.id}.json`,
-            totalCount: task.totalCount || task.total_count || 0,
-            groupName: task.groupName || task.group_name || '未知小组',
-            year: task.year || new Date(task.timestamp).getFullYear(),
-            month: task.month || (new Date(task.timestamp).getMonth() + 1)
-          }));
-          
-          // 保存为新的数组格式
-          await invoke('save_json_file', { 
-            filePath: 'coredata/history.json', 
-            data: JSON.stringify(convertedArray, null, 2) 
-          });
-          console.log('✅ 已转换并保存为数组格式:', convertedArray.length, '条记录');
-          
-          return convertedArray;
-        }
+        // 保存为新的数组格式
+        await invoke('save_json_file', { 
+          filePath: 'coredata/history.json', 
+          data: JSON.stringify(convertedArray) 
+        });
+        console.log('✅ 已转换并保存为数组格式:', convertedArray.length, '条记录');
+        
+        return convertedArray;
       }
       
       console.log('📝 历史记录为空，返回空数组');
@@ -779,7 +790,6 @@ async function scanAndRebuildHistoryIndex(): Promise<HistoryIndex[]> {
       
       try {
         // 使用Tauri API列出目录内容
-        const { invoke } = await import('@tauri-apps/api/core');
         const files = await invoke('list_directory', { dirPath: monthPath }) as string[];
         
         for (const fileName of files) {
@@ -815,7 +825,7 @@ async function scanAndRebuildHistoryIndex(): Promise<HistoryIndex[]> {
   }
   
   // 按时间戳排序，最新的在前
-  historyList.sort((a, b) => new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime());
+  sortByTimestampDesc(historyList);
   
   // 保存重建的索引
   if (historyList.length > 0) {
@@ -832,12 +842,11 @@ async function saveHistoryIndex(index: HistoryIndex[]): Promise<void> {
     console.log('💾 开始保存历史记录数组到history.json...');
     console.log('📊 数组数据:', index.length, '条记录');
     
-    // 直接保存为数组格式到文件
+    // 直接保存为数组格式到文件（索引每次保存都会整体重写，使用紧凑格式）
     try {
-      const { invoke } = await import('@tauri-apps/api/core');
       await invoke('save_json_file', { 
         filePath: 'coredata/history.json', 
-        data: JSON.stringify(index, null, 2) 
+        data: JSON.stringify(index) 
       });
       console.log('✅ 历史记录数组已直接保存到文件');
     } catch (fileError) {
@@ -869,136 +878,144 @@ function generateHistoryFileName(task: any): string {
   return `${cleanName}_${task.id}.json`;
 }
 
-// 保存单个历史记录到分年月文件夹
-export async function saveHistoryTask(task: any): Promise<void> {
+// 将任务写入分年月文件夹中的任务文件，返回对应的索引项（不更新history.json）
+async function writeHistoryTaskFile(task: any): Promise<HistoryIndex> {
+  // 解析年月信息
+  const { year, month } = parseYearMonth(task.timestamp);
+  console.log(`📅 解析时间: ${year}年${month}月`);
+  
+  // 生成文件名
+  const fileName = generateHistoryFileName(task);
+  const monthStr = month.toString().padStart(2, '0');
+  
+  // 首先确保年月目录存在
   try {
-    console.log('💾 开始保存历史记录到分年月文件夹...');
-    console.log('📋 任务数据:', task);
-    
-    // 解析年月信息
-    const { year, month } = parseYearMonth(task.timestamp);
-    console.log(`📅 解析时间: ${year}年${month}月`);
-    
-    // 生成文件名
-    const fileName = generateHistoryFileName(task);
-    const monthStr = month.toString().padStart(2, '0');
+    // 1. 确保coredata目录存在
+    try {
+      await invoke('list_directory', { dirPath: 'coredata' });
+      console.log('✅ coredata目录已存在');
+    } catch {
+      console.log('📁 创建coredata目录');
+      await invoke('save_json_file', { filePath: 'coredata/.dir_init', data: '{}' });
+    }
     
-    // 首先确保年月目录存在
+    // 2. 确保history目录存在
     try {
-      const { invoke } = await import('@tauri-apps/api/core');
-      
-      // 1. 确保coredata目录存在
-      try {
-        await invoke('list_directory', { dirPath: 'coredata' });
-        console.log('✅ coredata目录已存在');
-      } catch {
-        console.log('📁 创建coredata目录');
-        await invoke('save_json_file', { filePath: 'coredata/.dir_init', data: '{}' });
-      }
-      
-      // 2. 确保history目录存在
-      try {
-        await invoke('list_directory', { dirPath: 'coredata/history' });
-        console.log('✅ history目录已存在');
-      } catch {
-        console.log('📁 创建history目录');
-        await invoke('save_json_file', { filePath: 'coredata/history/.dir_init', data: '{}' });
-      }
-      
-      // 3. 确保年份目录存在
-      try {
-        await invoke('list_directory', { dirPath: `coredata/history/${year}` });
-        console.log(`✅ 年份目录已存在: ${year}`);
-      } catch {
-        console.log(`📁 创建年份目录: ${year}`);
-        await invoke('save_json_file', { filePath: `coredata/history/${year}/.dir_init`, data: '{}' });
-      }
-      
-      // 4. 确保月份目录存在
-      try {
-        await invoke('list_directory', { dirPath: `coredata/history/${year}/${monthStr}` });
-        console.log(`✅ 月份目录已存在: ${year}/${monthStr}`);
-      } catch {
-        console.log(`📁 创建月份目录: ${year}/${monthStr}`);
-        await invoke('save_json_file', { filePath: `coredata/history/${year}/${monthStr}/.dir_init`, data: '{}' });
-      }
-      
-      console.log(`✅ 年月目录结构已确保存在: coredata/history/${year}/${monthStr}/`);
-      
-    } catch (createDirError) {
-      console.warn('⚠️ 使用Tauri命令创建目录失败，继续使用Store方式:', createDirError);
+      await invoke('list_directory', { dirPath: 'coredata/history' });
+      console.log('✅ history目录已存在');
+    } catch {
+      console.log('📁 创建history目录');
+      await invoke('save_json_file', { filePath: 'coredata/history/.dir_init', data: '{}' });
     }
     
-    // 使用简化的相对路径，此时目录应该已经存在
-    const relativePath = `coredata/history/${year}/${monthStr}/${fileName}`;
-    console.log('📁 历史记录文件路径:', relativePath);
+    // 3. 确保年份目录存在
+    try {
+      await invoke('list_directory', { dirPath: `coredata/history/${year}` });
+      console.log(`✅ 年份目录已存在: ${year}`);
+    } catch {
+      console.log(`📁 创建年份目录: ${year}`);
+      await invoke('save_json_file', { filePath: `coredata/history/${year}/.dir_init`, data: '{}' });
+    }
     
-    // 强制保存单个任务文件
+    // 4. 确保月份目录存在
     try {
-      const taskStore = await Store.load(relativePath, { autoSave: false }); // 禁用autoSave，手动控制
-      await taskStore.set('task-data', task);
-      await taskStore.set('created-time', new Date().toISOString());
-      await taskStore.set('year', year);
-      await taskStore.set('month', month);
-      await taskStore.save(); // 强制同步保存
-      console.log('✅ 任务文件保存成功:', relativePath);
-    } catch (fileError) {
-      console.error('❌ 任务文件保存失败:', fileError);
-      
-      // 备用方案：如果Store.load失败，尝试直接使用Tauri命令保存
-      try {
-        const { invoke } = await import('@tauri-apps/api/core');
-        const taskData = {
-          'task-data': task,
-          'created-time': new Date().toISOString(),
-          'year': year,
-          'month': month
-        };
-        await invoke('save_json_file', { 
-          filePath: relativePath, 
-          data: JSON.stringify(taskData, null, 2) 
-        });
-        console.log('✅ 任务文件使用备用方案保存成功:', relativePath);
-      } catch (backupError) {
-        console.error('❌ 备用方案也失败:', backupError);
-        throw fileError; // 抛出原始错误
-      }
+      await invoke('list_directory', { dirPath: `coredata/history/${year}/${monthStr}` });
+      console.log(`✅ 月份目录已存在: ${year}/${monthStr}`);
+    } catch {
+      console.log(`📁 创建月份目录: ${year}/${monthStr}`);
+      await invoke('save_json_file', { filePath: `coredata/history/${year}/${monthStr}/.dir_init`, data: '{}' });
     }
     
-    // 更新history.json索引文件
+    console.log(`✅ 年月目录结构已确保存在: coredata/history/${year}/${monthStr}/`);
+    
+  } catch (createDirError) {
+    console.warn('⚠️ 使用Tauri命令创建目录失败，继续使用Store方式:', createDirError);
+  }
+  
+  // 使用简化的相对路径，此时目录应该已经存在
+  const relativePath = `coredata/history/${year}/${monthStr}/${fileName}`;
+  console.log('📁 历史记录文件路径:', relativePath);
+  
+  // 强制保存单个任务文件
+  try {
+    const taskStore = await Store.load(relativePath, { autoSave: false }); // 禁用autoSave，手动控制
+    await taskStore.set('task-data', task);
+    await taskStore.set('created-time', new Date().toISOString());
+    await taskStore.set('year', year);
+    await taskStore.set('month', month);
+    await taskStore.save(); // 强制同步保存
+    console.log('✅ 任务文件保存成功:', relativePath);
+  } catch (fileError) {
+    console.error('❌ 任务文件保存失败:', fileError);
+    
+    // 备用方案：如果Store.load失败，尝试直接使用Tauri命令保存
     try {
-      const currentIndex = await getHistoryIndex();
-      const newIndexEntry: HistoryIndex = {
-        id: task.id,
-        name: task.name,
-        timestamp: task.timestamp,
-        fileName: fileName,
-        relativePath: `${year}/${monthStr}/${fileName}`,
-        totalCount: task.total_count || task.results?.length || 0,
-        groupName: task.group_name || '未知小组',
-        year: year,
-        month: month
+      const taskData = {
+        'task-data': task,
+        'created-time': new Date().toISOString(),
+        'year': year,
+        'month': month
       };
-      
+      await invoke('save_json_file', { 
+        filePath: relativePath, 
+        data: JSON.stringify(taskData)
+      });
+      console.log('✅ 任务文件使用备用方案保存成功:', relativePath);
+    } catch (backupError) {
+      console.error('❌ 备用方案也失败:', backupError);
+      throw fileError; // 抛出原始错误
+    }
+  }
+  
+  return {
+    id: task.id,
+    name: task.name,
+    timestamp: task.timestamp,
+    fileName: fileName,
+    relativePath: `${year}/${monthStr}/${fileName}`,
+    totalCount: task.total_count || task.results?.length || 0,
+    groupName: task.group_name || '未知小组',
+    year: year,
+    month: month
+  };
+}
+
+// 把一批索引项合并进history.json，整批只读写一次索引文件
+async function updateHistoryIndex(entries: HistoryIndex[]): Promise<void> {
+  try {
+    const currentIndex = await getHistoryIndex();
+    
+    for (const newIndexEntry of entries) {
       // 检查是否已存在，如果存在则更新，否则添加
-      const existingIndex = currentIndex.findIndex(item => item.id === task.id);
+      const existingIndex = currentIndex.findIndex(item => item.id === newIndexEntry.id);
       if (existingIndex >= 0) {
         currentIndex[existingIndex] = newIndexEntry;
-        console.log('📝 更新现有历史记录索引');
+        debugLog('📝 更新现有历史记录索引');
       } else {
         currentIndex.unshift(newIndexEntry); // 新记录添加到开头
-        console.log('📝 添加新历史记录索引');
+        debugLog('📝 添加新历史记录索引');
       }
-      
-      // 保留最近100个记录
-      const trimmedIndex = currentIndex.slice(0, 100);
-      await saveHistoryIndex(trimmedIndex);
-      console.log('✅ 历史记录索引已更新，总数:', trimmedIndex.length);
-    } catch (indexError) {
-      console.error('❌ 索引更新失败:', indexError);
-      throw indexError;
     }
     
+    // 保留最近100个记录
+    const trimmedIndex = currentIndex.slice(0, 100);
+    await saveHistoryIndex(trimmedIndex);
+    console.log('✅ 历史记录索引已更新，总数:', trimmedIndex.length);
+  } catch (indexError) {
+    console.error('❌ 索引更新失败:', indexError);
+    throw indexError;
+  }
+}
+
+// 保存单个历史记录到分年月文件夹
+export async function saveHistoryTask(task: any): Promise<void> {
+  try {
+    console.log('💾 开始保存历史记录到分年月文件夹...');
+    debugLog('📋 任务数据:', task);
+    
+    const indexEntry = await writeHistoryTaskFile(task);
+    await updateHistoryIndex([indexEntry]);
+    
     console.log('🎉 历史记录保存完成!');
   } catch (error) {
     console.error('❌ 保存历史记录失败:', error);
@@ -1006,6 +1023,22 @@ export async function saveHistoryTask(task: any): Promise<void> {
   }
 }
 
+// 根据索引项加载历史记录文件
+async function loadHistoryTaskFile(indexEntry: HistoryIndex): Promise<any> {
+  // 使用索引中的相对路径构建完整路径
+  const historyRoot = await getHistoryRootPath();
+  const taskFilePath = await path.join(historyRoot, indexEntry.relativePath);
+  
+  debugLog('📁 加载历史记录文件:', taskFilePath);
+  
+  // 由Rust端按字节读取并解析整个任务文件，不必为每个文件创建一个Store实例
+  const taskFile = await invoke<any>('load_json_value', { filePath: taskFilePath });
+  const taskData = taskFile?.['task-data'];
+  
+  debugLog('✅ 历史记录已加载:', taskFilePath);
+  return taskData;
+}
+
 // 获取单个历史记录
 export async function getHistoryTask(taskId: string): Promise<any | null> {
   try {
@@ -1018,17 +1051,7 @@ export async function getHistoryTask(taskId: string): Promise<any | null> {
       return null;
     }
     
-    // 使用索引中的相对路径构建完整路径
-    const historyRoot = await getHistoryRootPath();
-    const taskFilePath = await path.join(historyRoot, indexEntry.relativePath);
-    
-    console.log('📁 加载历史记录文件:', taskFilePath);
-    
-    const taskStore = await Store.load(taskFilePath, { autoSave: false });
-    const taskData = await taskStore.get('task-data');
-    
-    console.log('✅ 历史记录已加载:', taskFilePath);
-    return taskData;
+    return await loadHistoryTaskFile(indexEntry);
   } catch (error) {
     console.error('❌ 获取历史记录失败:', error);
     return null;
@@ -1042,19 +1065,34 @@ export async function deleteHistoryTask(taskId: string): Promise<void> {
     
     // 先从history.json索引中移除
     const currentIndex = await getHistoryIndex();
+    const indexEntry = currentIndex.find(item => item.id === taskId);
     const updatedIndex = currentIndex.filter(item => item.id !== taskId);
     await saveHistoryIndex(updatedIndex);
     console.log('✅ 历史记录已从索引中移除:', taskId);
     
-    // 然后删除对应的文件
+    // 然后删除对应的文件：索引中记录了文件的相对路径，直接删除，
+    // 不必逐个列出年月目录并打开其中每个任务文件查找
     let fileFound = false;
-    for (let year = 2020; year <= new Date().getFullYear() + 1; year++) {
+    if (indexEntry?.relativePath) {
+      const taskFilePath = `coredata/history/${indexEntry.relativePath}`;
+      try {
+        if (await invoke<boolean>('file_exists', { filePath: taskFilePath })) {
+          await invoke('delete_file', { filePath: taskFilePath });
+          console.log('✅ 历史记录文件已删除:', taskFilePath);
+          fileFound = true;
+        }
+      } catch (deleteError) {
+        console.warn('⚠️ 按索引路径删除失败，改为扫描目录:', deleteError);
+      }
+    }
+    
+    // 索引路径无效时（如旧格式转换来的记录）再扫描目录查找
+    for (let year = 2020; !fileFound && year <= new Date().getFullYear() + 1; year++) {
       for (let month = 1; month <= 12; month++) {
         const monthStr = month.toString().padStart(2, '0');
         const monthPath = `coredata/history/${year}/${monthStr}`;
         
         try {
-          const { invoke } = await import('@tauri-apps/api/core');
           const files = await invoke('list_directory', { dirPath: monthPath }) as string[];
           
           for (const fileName of files) {
@@ -1100,8 +1138,6 @@ export async function clearHistoryData(): Promise<void> {
     
     // 删除整个history文件夹的内容
     try {
-      const { invoke } = await import('@tauri-apps/api/core');
-      
       // 扫描并删除所有历史文件
       for (let year = 2020; year <= new Date().getFullYear() + 1; year++) {
         for (let month = 1; month <= 12; month++) {
@@ -1134,38 +1170,26 @@ export async function clearHistoryData(): Promise<void> {
 }
 
 // 获取所有历史记录（兼容旧接口）
+// 任务文件读取失败时由索引信息生成的占位任务，其结果是伪数据，不能当作完整任务显示或编辑
+const indexPlaceholderTasks = new WeakSet<object>();
+
+// 判断任务是否为索引生成的占位任务
+export function isIndexPlaceholderTask(task: any): boolean {
+  return !!task && typeof task === 'object' && indexPlaceholderTasks.has(task);
+}
+
 export async function getHistoryData(): Promise<any[]> {
   try {
     const historyIndex = await getHistoryIndex();
     console.log('✅ 从文件夹结构加载历史记录索引:', historyIndex.length, '条记录');
     
     // 加载完整的历史记录数据，而不是只返回索引
-    const fullHistoryData: any[] = [];
-    
-    for (const indexItem of historyIndex) {
-      try {
-        // 为每个索引项加载完整的任务数据
-        const taskData = await getHistoryTask(indexItem.id);
-        if (taskData) {
-          fullHistoryData.push(taskData);
-        } else {
-          // 如果无法加载完整数据，至少返回索引信息（包含伪结果数据）
-          fullHistoryData.push({
-            id: indexItem.id,
-            name: indexItem.name,
-            timestamp: indexItem.timestamp,
-            total_count: indexItem.totalCount,
-            group_name: indexItem.groupName,
-            results: Array(indexItem.totalCount).fill(0).map((_, i) => `参与者${i + 1}`), // 生成伪结果数据
-            file_path: indexItem.fileName,
-            edit_protected: false,
-            edit_password: ''
-          });
-        }
-      } catch (taskError) {
-        console.warn(`⚠️ 加载任务数据失败 [${indexItem.id}]:`, taskError);
-        // 使用索引信息作为备用数据
-        fullHistoryData.push({
+    // 搜索和存储迁移都需要完整的结果列表，因此仍然全部加载；各任务文件互不依赖，
+    // 同时发起读取，总耗时约为最慢的一个文件而不是所有文件之和，结果顺序与索引一致
+    const fullHistoryData = await Promise.all(historyIndex.map(async (indexItem) => {
+      // 无法加载完整数据时，至少返回索引信息（包含伪结果数据）
+      const fromIndex = () => {
+        const placeholder = {
           id: indexItem.id,
           name: indexItem.name,
           timestamp: indexItem.timestamp,
@@ -1175,9 +1199,21 @@ export async function getHistoryData(): Promise<any[]> {
           file_path: indexItem.fileName,
           edit_protected: false,
           edit_password: ''
-        });
+        };
+        indexPlaceholderTasks.add(placeholder);
+        return placeholder;
+      };
+      
+      try {
+        // 为每个索引项加载完整的任务数据（直接使用已读取的索引项，避免逐条重新读取并查找索引）
+        const taskData = await loadHistoryTaskFile(indexItem);
+        return taskData || fromIndex();
+      } catch (taskError) {
+        console.warn(`⚠️ 加载任务数据失败 [${indexItem.id}]:`, taskError);
+        // 使用索引信息作为备用数据
+        return fromIndex();
       }
-    }
+    }));
     
     console.log('✅ 完整历史记录数据已加载:', fullHistoryData.length, '条记录');
     return fullHistoryData;
@@ -1193,9 +1229,12 @@ export async function saveHistoryData(historyTasks: any[]): Promise<void> {
     console.log('💾 开始批量保存历史记录到文件夹结构...');
     console.log('📊 待保存任务数:', historyTasks.length);
     
+    // 逐个写入任务文件，索引在最后统一更新一次，避免每个任务都整体重写history.json
+    const indexEntries: HistoryIndex[] = [];
     for (const task of historyTasks) {
-      await saveHistoryTask(task);
+      indexEntries.push(await writeHistoryTaskFile(task));
     }
+    await updateHistoryIndex(indexEntries);
     
     console.log('✅ 批量保存历史记录完成:', historyTasks.length, '个任务');
   } catch (error) {
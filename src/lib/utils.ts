@@ -1,6 +1,6 @@
 import { type ClassValue, clsx } from "clsx"
 import { twMerge } from "tailwind-merge"
-import { invoke } from '@tauri-apps/api/tauri';
+import { invoke } from '@tauri-apps/api/core';
 
 export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs))
@@ -260,6 +260,18 @@ export const formatDate = (date: Date): string => {
   }).format(date)
 }
 
+// 按时间戳倒序排序（最新的在前），每条记录只解析一次时间，而不是在每次比较时重复创建Date
+export const sortByTimestampDesc = (items: any[]) => {
+  const times = new Map<any, number>()
+  for (const item of items) {
+    times.set(item, new Date(item.timestamp).getTime())
+  }
+  items.sort((a, b) => times.get(b)! - times.get(a)!)
+}
+
+// 仅在开发构建中输出的调试日志，生产构建中为空函数，循环和大对象日志不再产生控制台开销
+export const debugLog: (...args: any[]) => void = process.env.NODE_ENV === 'production' ? () => {} : console.log.bind(console)
+
 /**
  * 检查并申请管理员权限
  * @returns 如果已经有管理员权限或用户同意申请权限则返回 true，否则返回 false